@@ -1,5 +1,16 @@
 import anthropic
-from typing import List, Optional, Dict, Any
+import asyncio
+import contextvars
+import hashlib
+import threading
+import time
+import httpx
+import orjson
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import List, Optional, Dict, Any, Iterable, Iterator, Tuple
 import logging
 import os
 try:
@@ -7,12 +18,60 @@ try:
 except Exception:
     ai = None
 
+# Connection pool shared by all LLM SDK clients in the process
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+_HTTP_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+_HTTP2_AVAILABLE = find_spec("h2") is not None  # httpx needs the h2 extra for HTTP/2
+
+@lru_cache(maxsize=1)
+def get_http_client() -> httpx.Client:
+    """Return the process-wide keep-alive HTTP client so TLS setup is paid once"""
+    return httpx.Client(http2=_HTTP2_AVAILABLE, limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+
+@lru_cache(maxsize=1)
+def get_async_http_client() -> httpx.AsyncClient:
+    """Return the process-wide keep-alive HTTP client for async SDK clients"""
+    return httpx.AsyncClient(http2=_HTTP2_AVAILABLE, limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+
 def mask_api_key(api_key: str) -> str:
     """Mask API key for logging purposes"""
     if not api_key or len(api_key) < 8:
         return "****"
     return f"{api_key[:4]}****{api_key[-4:]}"
 
+
+class ResponseCache:
+    """Thread-safe LRU cache of generated responses with a time-to-live"""
+    
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+    
+    def set(self, key: str, value: str):
+        """Store a response, evicting the least recently used entry when full"""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
 class AIGenerator:
     """Handles interactions with Anthropic's Claude API for generating responses"""
     
@@ -35,11 +94,16 @@ Response Requirements:
 Remember: SEARCH FIRST, then answer based only on course materials found.
 """
     
-    def __init__(self, config):
+    def __init__(self, config, provider: Optional[str] = None):
         """Initialize with provider routing using config.
 
         Preferred order: OpenAI -> Anthropic -> Google Gemini -> xAI Grok.
         Anthropic path retains tool-use integration. Others use AISuite.
+
+        Args:
+            config: Application config holding API keys and model names
+            provider: Force one of "openai", "anthropic", "google" or "xai"
+                instead of the first provider with a key
         """
         self.logger = logging.getLogger(__name__)
         self.config = config
@@ -49,22 +113,40 @@ Remember: SEARCH FIRST, then answer based only on course materials found.
         anthropic_key = getattr(config, "ANTHROPIC_API_KEY", os.getenv("ANTHROPIC_API_KEY", ""))
         google_key = getattr(config, "GOOGLE_API_KEY", os.getenv("GOOGLE_API_KEY", ""))
         xai_key = getattr(config, "XAI_API_KEY", os.getenv("XAI_API_KEY", ""))
+        if provider is not None:
+            keys = {"openai": openai_key, "anthropic": anthropic_key, "google": google_key, "xai": xai_key}
+            if provider not in keys:
+                raise ValueError(f"Unknown provider: {provider}")
+            # Blank every other key so the routing below picks only the requested provider
+            openai_key, anthropic_key, google_key, xai_key = (
+                key if name == provider else "" for name, key in keys.items()
+            )
 
         self.provider_mode = None  # "anthropic" or "aisuite"
         self.model = None
+        self.async_client = None  # Only set for providers with a native async SDK
+        # The SDKs retry 408/429/5xx with exponential backoff and jitter
+        max_retries = getattr(config, "LLM_MAX_RETRIES", 3)
 
         if openai_key:
             # AISuite path with OpenAI
             if ai is None:
                 raise RuntimeError("aisuite is not installed but OPENAI_API_KEY is set. Add 'aisuite' to dependencies.")
             self.provider_mode = "aisuite"
-            self.client = ai.Client()
+            self.client = ai.Client(provider_configs={
+                "openai": {"http_client": get_http_client(), "max_retries": max_retries}
+            })
             self.model = f"openai:{getattr(config, 'OPENAI_MODEL', 'gpt-4o')}"
             self.logger.info("Using OpenAI provider with key: %s", mask_api_key(openai_key))
         elif anthropic_key:
             # Anthropic SDK path (keeps tool-use)
             self.provider_mode = "anthropic"
-            self.client = anthropic.Anthropic(api_key=anthropic_key)
+            self.client = anthropic.Anthropic(
+                api_key=anthropic_key, http_client=get_http_client(), max_retries=max_retries
+            )
+            self.async_client = anthropic.AsyncAnthropic(
+                api_key=anthropic_key, http_client=get_async_http_client(), max_retries=max_retries
+            )
             self.model = getattr(config, 'ANTHROPIC_MODEL', 'claude-sonnet-4-20250514')
             self.logger.info("Using Anthropic provider with key: %s", mask_api_key(anthropic_key))
         elif google_key:
@@ -87,6 +169,12 @@ Remember: SEARCH FIRST, then answer based only on course materials found.
             self.logger.error("No supported LLM API keys found. Set OPENAI_API_KEY, ANTHROPIC_API_KEY, GOOGLE_API_KEY, or XAI_API_KEY.")
             raise ValueError("No supported LLM API keys found.")
 
+        # Exact-match cache for responses that did not need tools
+        self.response_cache = ResponseCache(
+            maxsize=getattr(config, "RESPONSE_CACHE_SIZE", 1024),
+            ttl=getattr(config, "RESPONSE_CACHE_TTL", 3600)
+        )
+
         # Pre-build base API parameters (used for Anthropic)
         self.base_params = {
             "model": self.model if self.provider_mode == "anthropic" else None,
@@ -110,25 +198,13 @@ Remember: SEARCH FIRST, then answer based only on course materials found.
         Returns:
             Generated response as string
         """
-        
-        # Build system content efficiently - avoid string ops when possible
-        system_content = (
-            f"{self.SYSTEM_PROMPT}\n\nPrevious conversation:\n{conversation_history}"
-            if conversation_history 
-            else self.SYSTEM_PROMPT
-        )
+        cache_key = self.cache_key(query, conversation_history)
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            return cached
         
         if self.provider_mode == "anthropic":
-            # Prepare API call parameters efficiently
-            api_params = {
-                **self.base_params,
-                "messages": [{"role": "user", "content": query}],
-                "system": system_content
-            }
-            # Add tools if available (Anthropic tool_use)
-            if tools:
-                api_params["tools"] = tools
-                api_params["tool_choice"] = {"type": "auto"}
+            api_params = self._build_anthropic_params(query, conversation_history, tools)
             # Get response from Claude
             try:
                 response = self.client.messages.create(**api_params)
@@ -146,85 +222,244 @@ Remember: SEARCH FIRST, then answer based only on course materials found.
                 self.logger.exception("Unexpected error during Anthropic messages.create")
                 raise
             if response.stop_reason == "tool_use" and tool_manager:
-                return self._handle_tool_execution(response, api_params, tool_manager)
-            return response.content[0].text
+                return self._handle_tool_execution(response, api_params["messages"], api_params["system"], tool_manager)
+            text = response.content[0].text
+            self.response_cache.set(cache_key, text)
+            return text
         else:
             # AISuite path (OpenAI/Gemini/xAI) with tool support
-            messages = [
-                {"role": "system", "content": system_content},
-                {"role": "user", "content": query},
-            ]
-            
-            # Prepare API call parameters
-            api_params = {
-                "model": self.model,
-                "messages": messages,
-                "temperature": 0
-            }
-            
-            # Add tools if available (OpenAI function calling format)
-            if tools and tool_manager:
-                api_params["tools"] = tools  # Tools are already in correct format from ToolManager
-                api_params["tool_choice"] = "auto"
+            api_params = self._build_aisuite_params(query, conversation_history, tools, tool_manager)
             
             try:
                 response = self.client.chat.completions.create(**api_params)
                 
                 # Check if response contains tool calls
                 if (response.choices and response.choices[0].message.tool_calls and tool_manager):
-                    return self._handle_openai_tool_execution(response, api_params, tool_manager)
+                    return self._handle_openai_tool_execution(response, api_params["messages"], tool_manager)
                 
                 # Regular response without tool calls
                 text = response.choices[0].message.content if response and response.choices else ""
+                self.response_cache.set(cache_key, text)
                 return text
             except Exception:
                 self.logger.exception("AISuite chat.completions.create failed for model %s", self.model)
                 raise
     
-    def _handle_tool_execution(self, initial_response, base_params: Dict[str, Any], tool_manager):
+    async def agenerate_response(self, query: str,
+                                 conversation_history: Optional[str] = None,
+                                 tools: Optional[List] = None,
+                                 tool_manager=None) -> str:
         """
-        Handle execution of tool calls and get follow-up response.
+        Async variant of generate_response() that does not block the event loop.
+        
+        Anthropic calls use the native async client and tools run in a worker
+        thread. AISuite has no async interface, so the whole sync call is
+        offloaded to a thread instead.
         
         Args:
-            initial_response: The response containing tool use requests
-            base_params: Base API parameters
+            query: The user's question or request
+            conversation_history: Previous messages for context
+            tools: Available tools the AI can use
             tool_manager: Manager to execute tools
             
         Returns:
-            Final response text after tool execution
+            Generated response as string
         """
-        # Start with existing messages
-        messages = base_params["messages"].copy()
+        if self.async_client is None:
+            return await asyncio.to_thread(
+                self.generate_response, query, conversation_history, tools, tool_manager
+            )
         
-        # Add AI's tool use response
-        messages.append({"role": "assistant", "content": initial_response.content})
+        cache_key = self.cache_key(query, conversation_history)
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            return cached
         
-        # Execute all tool calls and collect results
-        tool_results = []
-        for content_block in initial_response.content:
-            if content_block.type == "tool_use":
-                tool_result = tool_manager.execute_tool(
-                    content_block.name, 
-                    **content_block.input
+        api_params = self._build_anthropic_params(query, conversation_history, tools)
+        try:
+            response = await self.async_client.messages.create(**api_params)
+            if response.stop_reason == "tool_use" and tool_manager:
+                # Tools hit the vector store synchronously, so they run in worker threads
+                final_params = await self._aprepare_anthropic_followup(
+                    response, api_params["messages"], api_params["system"], tool_manager
                 )
-                
-                tool_results.append({
-                    "type": "tool_result",
-                    "tool_use_id": content_block.id,
-                    "content": tool_result
-                })
+                response = await self.async_client.messages.create(**final_params)
+                return response.content[0].text
+            text = response.content[0].text
+            self.response_cache.set(cache_key, text)
+            return text
+        except anthropic.APIStatusError as e:
+            status = getattr(e, 'status_code', None)
+            body = getattr(e, 'response', None)
+            self.logger.exception("Anthropic APIStatusError during async messages.create: status=%s, body=%s", status, body)
+            raise
+        except Exception:
+            self.logger.exception("Unexpected error during Anthropic async messages.create")
+            raise
+    
+    def generate_response_stream(self, query: str,
+                                 conversation_history: Optional[str] = None,
+                                 tools: Optional[List] = None,
+                                 tool_manager=None,
+                                 batch_size: int = 8) -> Iterator[str]:
+        """
+        Generate AI response as a stream of text chunks.
         
-        # Add tool results as single message
-        if tool_results:
-            messages.append({"role": "user", "content": tool_results})
+        Tool calls are resolved with a regular request first; only the final
+        answer is streamed. Token deltas are batched to cut per-chunk overhead.
         
-        # Prepare final API call without tools
-        final_params = {
+        Args:
+            query: The user's question or request
+            conversation_history: Previous messages for context
+            tools: Available tools the AI can use
+            tool_manager: Manager to execute tools
+            batch_size: Number of token deltas to join per yielded chunk
+            
+        Yields:
+            Chunks of the generated response text
+        """
+        if self.provider_mode == "anthropic":
+            api_params = self._build_anthropic_params(query, conversation_history, tools)
+            try:
+                if tools and tool_manager:
+                    response = self.client.messages.create(**api_params)
+                    if response.stop_reason != "tool_use":
+                        yield response.content[0].text
+                        return
+                    api_params = self._prepare_anthropic_followup(response, api_params["messages"], api_params["system"], tool_manager)
+                with self.client.messages.stream(**api_params) as stream:
+                    yield from self._batch_deltas(stream.text_stream, batch_size)
+            except anthropic.APIStatusError as e:
+                status = getattr(e, 'status_code', None)
+                self.logger.exception("Anthropic APIStatusError during streamed response: status=%s", status)
+                raise
+            except Exception:
+                self.logger.exception("Unexpected error during Anthropic streamed response")
+                raise
+        else:
+            api_params = self._build_aisuite_params(query, conversation_history, tools, tool_manager)
+            try:
+                response = self.client.chat.completions.create(**api_params)
+                if not (response.choices and response.choices[0].message.tool_calls and tool_manager):
+                    yield response.choices[0].message.content if response.choices else ""
+                    return
+                final_params = self._prepare_openai_followup(response, api_params["messages"], tool_manager)
+                if not self.model.startswith("openai:"):
+                    # Only the OpenAI provider passes stream=True through AISuite
+                    final_response = self.client.chat.completions.create(**final_params)
+                    yield final_response.choices[0].message.content if final_response.choices else ""
+                    return
+                stream = self.client.chat.completions.create(**final_params, stream=True)
+                deltas = (
+                    chunk.choices[0].delta.content
+                    for chunk in stream
+                    if chunk.choices and chunk.choices[0].delta.content
+                )
+                yield from self._batch_deltas(deltas, batch_size)
+            except Exception:
+                self.logger.exception("AISuite streamed response failed for model %s", self.model)
+                raise
+    
+    @staticmethod
+    def _batch_deltas(deltas: Iterable[str], batch_size: int) -> Iterator[str]:
+        """Join every batch_size text deltas into one chunk"""
+        batch = []
+        for delta in deltas:
+            batch.append(delta)
+            if len(batch) >= batch_size:
+                yield "".join(batch)
+                batch = []
+        if batch:
+            yield "".join(batch)
+    
+    def cache_key(self, query: str, conversation_history: Optional[str] = None) -> str:
+        """Hash the system prompt, conversation history and query into a response cache key"""
+        material = "\x00".join((self.SYSTEM_PROMPT, conversation_history or "", query))
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+    
+    def _build_anthropic_params(self, query: str,
+                                conversation_history: Optional[str] = None,
+                                tools: Optional[List] = None) -> Dict[str, Any]:
+        """Build Anthropic messages.create parameters for a query"""
+        # Prepare API call parameters efficiently
+        api_params = {
             **self.base_params,
+            "messages": [{"role": "user", "content": query}],
+            "system": self._build_anthropic_system(conversation_history)
+        }
+        # Add tools if available (Anthropic tool_use)
+        if tools:
+            api_params["tools"] = self._with_tool_cache_breakpoint(tools)
+            api_params["tool_choice"] = {"type": "auto"}
+        return api_params
+    
+    def _build_aisuite_params(self, query: str,
+                              conversation_history: Optional[str] = None,
+                              tools: Optional[List] = None,
+                              tool_manager=None) -> Dict[str, Any]:
+        """Build AISuite chat.completions.create parameters for a query"""
+        # Keep the static prompt as its own message so the prefix stays byte-stable
+        # across turns and provider-side prompt caching can reuse it
+        messages = [{"role": "system", "content": self.SYSTEM_PROMPT}]
+        if conversation_history:
+            messages.append({"role": "system", "content": f"Previous conversation:\n{conversation_history}"})
+        messages.append({"role": "user", "content": query})
+        
+        # Prepare API call parameters
+        api_params = {
+            "model": self.model,
             "messages": messages,
-            "system": base_params["system"]
+            "temperature": 0
         }
         
+        # Add tools if available (OpenAI function calling format)
+        if tools and tool_manager:
+            api_params["tools"] = tools  # Tools are already in correct format from ToolManager
+            api_params["tool_choice"] = "auto"
+        return api_params
+    
+    def _build_anthropic_system(self, conversation_history: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Build Anthropic system blocks with the static prompt marked for prompt caching.
+
+        The conversation history goes in a separate, uncached block so the cached
+        prefix stays byte-identical across turns.
+        """
+        system_blocks = [{
+            "type": "text",
+            "text": self.SYSTEM_PROMPT,
+            "cache_control": {"type": "ephemeral"}
+        }]
+        if conversation_history:
+            system_blocks.append({
+                "type": "text",
+                "text": f"Previous conversation:\n{conversation_history}"
+            })
+        return system_blocks
+
+    @staticmethod
+    def _with_tool_cache_breakpoint(tools: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Return a copy of tools with cache_control on the last entry so tool schemas join the cached prefix"""
+        cached_tools = list(tools)
+        cached_tools[-1] = {**cached_tools[-1], "cache_control": {"type": "ephemeral"}}
+        return cached_tools
+
+    def _handle_tool_execution(self, initial_response, messages: List[Dict[str, Any]],
+                               system: List[Dict[str, Any]], tool_manager):
+        """
+        Handle execution of tool calls and get follow-up response.
+        
+        Args:
+            initial_response: The response containing tool use requests
+            messages: Messages sent with the initial request, extended in place
+            system: System blocks sent with the initial request
+            tool_manager: Manager to execute tools
+            
+        Returns:
+            Final response text after tool execution
+        """
+        final_params = self._prepare_anthropic_followup(initial_response, messages, system, tool_manager)
+        
         # Get final response
         try:
             final_response = self.client.messages.create(**final_params)
@@ -243,46 +478,134 @@ Remember: SEARCH FIRST, then answer based only on course materials found.
             self.logger.exception("Unexpected error during Anthropic follow-up messages.create")
             raise
     
-    def _convert_tools_to_openai_format(self, anthropic_tools: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _prepare_anthropic_followup(self, initial_response, messages: List[Dict[str, Any]],
+                                    system: List[Dict[str, Any]], tool_manager) -> Dict[str, Any]:
         """
-        Convert Anthropic tool definitions to OpenAI function calling format.
+        Execute Anthropic tool calls and build the parameters for the follow-up call.
         
         Args:
-            anthropic_tools: List of Anthropic tool definitions
+            initial_response: The response containing tool use requests
+            messages: Messages sent with the initial request, extended in place
+            system: System blocks sent with the initial request
+            tool_manager: Manager to execute tools
             
         Returns:
-            List of OpenAI tool definitions
+            API parameters for the final call (without tools)
+        """
+        tool_uses = [block for block in initial_response.content if block.type == "tool_use"]
+        results = self._execute_tool_calls([(block.name, block.input) for block in tool_uses], tool_manager)
+        return self._build_anthropic_followup(initial_response, tool_uses, results, messages, system)
+    
+    async def _aprepare_anthropic_followup(self, initial_response, messages: List[Dict[str, Any]],
+                                           system: List[Dict[str, Any]], tool_manager) -> Dict[str, Any]:
+        """Async variant of _prepare_anthropic_followup() that runs tool calls concurrently"""
+        tool_uses = [block for block in initial_response.content if block.type == "tool_use"]
+        results = await self._aexecute_tool_calls([(block.name, block.input) for block in tool_uses], tool_manager)
+        return self._build_anthropic_followup(initial_response, tool_uses, results, messages, system)
+    
+    def _build_anthropic_followup(self, initial_response, tool_uses: List[Any], results: List[Any],
+                                  messages: List[Dict[str, Any]], system: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Append the tool use turn and its results to messages and return follow-up parameters"""
+        # Add AI's tool use response
+        messages.append({"role": "assistant", "content": initial_response.content})
+        
+        # Collect results in the original tool call order
+        tool_results = []
+        for content_block, tool_result in zip(tool_uses, results):
+            if isinstance(tool_result, Exception):
+                self.logger.error("Error executing tool %s: %s", content_block.name, str(tool_result))
+                tool_results.append({
+                    "type": "tool_result",
+                    "tool_use_id": content_block.id,
+                    "content": f"Error executing tool: {str(tool_result)}",
+                    "is_error": True
+                })
+            else:
+                tool_results.append({
+                    "type": "tool_result",
+                    "tool_use_id": content_block.id,
+                    "content": tool_result
+                })
+        
+        # Add tool results as single message
+        if tool_results:
+            messages.append({"role": "user", "content": tool_results})
+        
+        # Prepare final API call without tools
+        return {
+            **self.base_params,
+            "messages": messages,
+            "system": system
+        }
+    
+    @staticmethod
+    def _execute_tool_calls(calls: List[Tuple[str, Dict[str, Any]]], tool_manager) -> List[Any]:
         """
-        openai_tools = []
-        for tool in anthropic_tools:
-            openai_tool = {
-                "type": "function",
-                "function": {
-                    "name": tool["name"],
-                    "description": tool["description"],
-                    "parameters": tool["input_schema"]
-                }
-            }
-            openai_tools.append(openai_tool)
-        return openai_tools
+        Execute (name, arguments) tool calls concurrently in worker threads.
+        
+        Returns results in call order; a call that raised yields its exception instead.
+        """
+        if len(calls) <= 1:
+            results = []
+            for name, args in calls:
+                try:
+                    results.append(tool_manager.execute_tool(name, **args))
+                except Exception as e:
+                    results.append(e)
+            return results
+        
+        with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+            # Run each call in a copy of this context so per-query source collection still applies
+            futures = [
+                executor.submit(contextvars.copy_context().run, tool_manager.execute_tool, name, **args)
+                for name, args in calls
+            ]
+        return [future.exception() or future.result() for future in futures]
     
-    def _handle_openai_tool_execution(self, initial_response, base_params: Dict[str, Any], tool_manager):
+    @staticmethod
+    async def _aexecute_tool_calls(calls: List[Tuple[str, Dict[str, Any]]], tool_manager) -> List[Any]:
+        """Async variant of _execute_tool_calls() built on asyncio.gather"""
+        return await asyncio.gather(
+            *(asyncio.to_thread(tool_manager.execute_tool, name, **args) for name, args in calls),
+            return_exceptions=True
+        )
+    
+    def _handle_openai_tool_execution(self, initial_response, messages: List[Dict[str, Any]], tool_manager):
         """
         Handle execution of OpenAI tool calls and get follow-up response.
         
         Args:
             initial_response: The response containing tool calls
-            base_params: Base API parameters
+            messages: Messages sent with the initial request, extended in place
             tool_manager: Manager to execute tools
             
         Returns:
             Final response text after tool execution
         """
-        import json
+        final_params = self._prepare_openai_followup(initial_response, messages, tool_manager)
         
-        # Start with existing messages
-        messages = base_params["messages"].copy()
+        # Get final response
+        try:
+            final_response = self.client.chat.completions.create(**final_params)
+            text = final_response.choices[0].message.content if final_response and final_response.choices else ""
+            self.logger.debug("OpenAI final response after tool execution. preview=%s", text[:100] if text else "<no content>")
+            return text
+        except Exception:
+            self.logger.exception("Error during OpenAI follow-up chat.completions.create")
+            raise
+    
+    def _prepare_openai_followup(self, initial_response, messages: List[Dict[str, Any]], tool_manager) -> Dict[str, Any]:
+        """
+        Execute OpenAI tool calls and build the parameters for the follow-up call.
         
+        Args:
+            initial_response: The response containing tool calls
+            messages: Messages sent with the initial request, extended in place
+            tool_manager: Manager to execute tools
+            
+        Returns:
+            API parameters for the final call (without tools)
+        """
         # Add AI's tool call response
         assistant_message = {
             "role": "assistant",
@@ -291,49 +614,44 @@ Remember: SEARCH FIRST, then answer based only on course materials found.
         }
         messages.append(assistant_message)
         
-        # Execute all tool calls and collect results
-        for tool_call in initial_response.choices[0].message.tool_calls:
+        # Parse tool call arguments up front; malformed ones are reported back as errors
+        tool_calls = initial_response.choices[0].message.tool_calls
+        parsed_args = []
+        for tool_call in tool_calls:
             try:
-                # Parse tool call arguments
-                function_args = json.loads(tool_call.function.arguments)
-                
-                # Execute the tool
-                tool_result = tool_manager.execute_tool(
-                    tool_call.function.name,
-                    **function_args
-                )
-                
-                # Add tool result message
-                tool_message = {
-                    "role": "tool",
-                    "tool_call_id": tool_call.id,
-                    "content": tool_result
-                }
-                messages.append(tool_message)
-                
+                parsed_args.append(orjson.loads(tool_call.function.arguments))
             except Exception as e:
-                self.logger.error("Error executing tool %s: %s", tool_call.function.name, str(e))
+                parsed_args.append(e)
+        
+        # Execute all tool calls concurrently
+        runnable = [
+            (tool_call.function.name, function_args)
+            for tool_call, function_args in zip(tool_calls, parsed_args)
+            if not isinstance(function_args, Exception)
+        ]
+        executed = iter(self._execute_tool_calls(runnable, tool_manager))
+        
+        # Add tool result messages in the original tool call order
+        for tool_call, function_args in zip(tool_calls, parsed_args):
+            tool_result = function_args if isinstance(function_args, Exception) else next(executed)
+            if isinstance(tool_result, Exception):
+                self.logger.error("Error executing tool %s: %s", tool_call.function.name, str(tool_result))
                 # Add error message
-                error_message = {
+                messages.append({
                     "role": "tool",
                     "tool_call_id": tool_call.id,
-                    "content": f"Error executing tool: {str(e)}"
-                }
-                messages.append(error_message)
+                    "content": f"Error executing tool: {str(tool_result)}"
+                })
+            else:
+                messages.append({
+                    "role": "tool",
+                    "tool_call_id": tool_call.id,
+                    "content": tool_result
+                })
         
         # Prepare final API call without tools to get the final response
-        final_params = {
-            "model": base_params["model"],
+        return {
+            "model": self.model,
             "messages": messages,
-            "temperature": base_params["temperature"]
+            "temperature": 0
         }
-        
-        # Get final response
-        try:
-            final_response = self.client.chat.completions.create(**final_params)
-            text = final_response.choices[0].message.content if final_response and final_response.choices else ""
-            self.logger.debug("OpenAI final response after tool execution. preview=%s", text[:100] if text else "<no content>")
-            return text
-        except Exception:
-            self.logger.exception("Error during OpenAI follow-up chat.completions.create")
-            raise
\ No newline at end of file
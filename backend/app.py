@@ -1,21 +1,24 @@
 import warnings
 warnings.filterwarnings("ignore", message="resource_tracker: There appear to be.*")
 
-from fastapi import FastAPI, HTTPException, Request, Depends
+from fastapi import APIRouter, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from pydantic import BaseModel, Field
-from typing import List, Optional
+from pydantic import BaseModel, Field, StringConstraints
+from typing import Annotated, List, Optional
 import os
+import asyncio
 import logging
-import re
 import anthropic
+import orjson
+from contextlib import asynccontextmanager
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
-from fastapi.responses import Response
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
 from datetime import datetime, timezone
+from pathlib import Path
 
 # Create a module logger
 logger = logging.getLogger(__name__)
@@ -35,8 +38,43 @@ from .rag_system import RAGSystem
 # Initialize rate limiter
 limiter = Limiter(key_func=get_remote_address)
 
+def load_initial_documents():
+    """Load course documents from the docs folder into the vector store"""
+    # Get absolute path to docs folder
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    docs_path = os.path.join(os.path.dirname(current_dir), "docs")
+    
+    if os.path.exists(docs_path):
+        print(f"Loading initial documents from {docs_path}...")
+        try:
+            courses, chunks = rag_system.add_course_folder(docs_path, clear_existing=False)
+            print(f"Loaded {courses} courses with {chunks} chunks")
+        except Exception as e:
+            print(f"Error loading documents: {e}")
+    else:
+        print(f"Documents folder not found at {docs_path}")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm up the embedding model and start background ingestion when INGEST_ON_STARTUP is set"""
+    # Move embedding model warm-up from the first query to startup
+    await asyncio.to_thread(rag_system.vector_store.warmup)
+    
+    # Ingestion normally runs as a separate `python -m backend.ingest` step
+    ingestion = None
+    if config.INGEST_ON_STARTUP:
+        ingestion = asyncio.create_task(asyncio.to_thread(load_initial_documents))
+    yield
+    if ingestion is not None and not ingestion.done():
+        ingestion.cancel()
+
 # Initialize FastAPI app
-app = FastAPI(title="Course Materials RAG System", root_path="")
+app = FastAPI(
+    title="Course Materials RAG System",
+    root_path="",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
+)
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
@@ -49,7 +87,7 @@ app.add_middleware(
 # Enable CORS with restricted origins for security
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=config.ALLOWED_ORIGINS,
+    allow_origins=frozenset(config.ALLOWED_ORIGINS),  # Checked per request with `origin in ...`
     allow_credentials=True,
     allow_methods=["GET", "POST"],
     allow_headers=["Content-Type", "Authorization"],
@@ -82,6 +120,10 @@ async def add_security_headers(request: Request, call_next):
 # Initialize RAG system
 rag_system = RAGSystem(config)
 
+# Allowed session ID format; pydantic-core compiles it once and checks it without calling into Python
+SESSION_ID_PATTERN = r"^[a-zA-Z0-9_-]+$"
+SessionId = Annotated[str, StringConstraints(pattern=SESSION_ID_PATTERN, max_length=100)]
+
 # Pydantic models for request/response
 class QueryRequest(BaseModel):
     """Request model for course queries with validation"""
@@ -92,10 +134,8 @@ class QueryRequest(BaseModel):
         description="User query for course content",
         example="What is the main topic of lesson 1?"
     )
-    session_id: Optional[str] = Field(
+    session_id: Optional[SessionId] = Field(
         None,
-        max_length=100,
-        pattern=r"^[a-zA-Z0-9_-]+$",
         description="Optional session ID for conversation context"
     )
 
@@ -111,8 +151,10 @@ class CourseStats(BaseModel):
     course_titles: List[str]
 
 # API Endpoints
+# Grouped on a router that is included before the frontend's catch-all mount at "/"
+api_router = APIRouter(prefix="/api")
 
-@app.post("/api/query", response_model=QueryResponse)
+@api_router.post("/query", response_model=QueryResponse)
 @limiter.limit(config.RATE_LIMIT_WINDOW)
 async def query_documents(request: Request, query_req: QueryRequest):
     """Process a query and return response with sources"""
@@ -122,8 +164,23 @@ async def query_documents(request: Request, query_req: QueryRequest):
         if not session_id:
             session_id = rag_system.session_manager.create_session()
         
-        # Process query using RAG system
-        answer, sources = rag_system.query(query_req.query, session_id)
+        # Serve near-duplicate questions from the semantic cache. Follow-ups depend
+        # on the conversation so they are only matched within their own session.
+        semantic_cache = rag_system.semantic_cache
+        cached = None
+        if semantic_cache:
+            has_history = rag_system.session_manager.get_conversation_history(session_id) is not None
+            bucket = session_id if has_history else semantic_cache.GLOBAL_BUCKET
+            cached = await asyncio.to_thread(semantic_cache.lookup, query_req.query, bucket)
+        
+        if cached:
+            answer, sources = cached
+            rag_system.session_manager.add_exchange(session_id, query_req.query, answer)
+        else:
+            # Process query using RAG system
+            answer, sources = await rag_system.aquery(query_req.query, session_id)
+            if semantic_cache:
+                await asyncio.to_thread(semantic_cache.store, query_req.query, answer, sources, bucket)
         
         return QueryResponse(
             answer=answer,
@@ -155,12 +212,41 @@ async def query_documents(request: Request, query_req: QueryRequest):
                     session_id, type(e).__name__)
         raise HTTPException(status_code=500, detail="Internal server error.")
 
-@app.get("/api/courses", response_model=CourseStats)
+@api_router.post("/query/stream")
+@limiter.limit(config.RATE_LIMIT_WINDOW)
+async def query_documents_stream(request: Request, query_req: QueryRequest):
+    """Process a query and stream the response as server-sent events"""
+    # Create session if not provided
+    session_id = query_req.session_id
+    if not session_id:
+        session_id = rag_system.session_manager.create_session()
+
+    def event_stream():
+        try:
+            for event in rag_system.query_stream(query_req.query, session_id):
+                if event["type"] == "token":
+                    yield b"event: token\ndata: " + orjson.dumps({"text": event["text"]}) + b"\n\n"
+                else:
+                    payload = {"sources": event["sources"], "session_id": session_id}
+                    yield b"event: done\ndata: " + orjson.dumps(payload) + b"\n\n"
+        except Exception as e:
+            # Headers are already sent, so report a generic error event instead of a status code
+            logger.error("/api/query/stream failed. session_id=%s, error_type=%s",
+                        session_id, type(e).__name__)
+            yield b"event: error\ndata: " + orjson.dumps({"detail": "AI service error occurred."}) + b"\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@api_router.get("/courses", response_model=CourseStats)
 @limiter.limit("30/minute")
 async def get_course_stats(request: Request):
     """Get course analytics and statistics"""
     try:
-        analytics = rag_system.get_course_analytics()
+        analytics = await asyncio.to_thread(rag_system.get_course_analytics)
         return CourseStats(
             total_courses=analytics["total_courses"],
             course_titles=analytics["course_titles"]
@@ -182,12 +268,12 @@ async def health_check():
         }
     }
 
-@app.get("/api/metrics")
+@api_router.get("/metrics")
 @limiter.limit("10/minute")
 async def get_metrics(request: Request):
     """Basic metrics endpoint for monitoring"""
     try:
-        course_count = rag_system.vector_store.get_course_count()
+        course_count = await asyncio.to_thread(rag_system.vector_store.get_course_count)
         return {
             "total_courses": course_count,
             "status": "operational"
@@ -196,30 +282,9 @@ async def get_metrics(request: Request):
         logger.error("Metrics endpoint failed. error_type=%s", type(e).__name__)
         raise HTTPException(status_code=500, detail="Metrics unavailable.")
 
-@app.on_event("startup")
-async def startup_event():
-    """Load initial documents on startup"""
-    # Get absolute path to docs folder
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    docs_path = os.path.join(os.path.dirname(current_dir), "docs")
-    
-    if os.path.exists(docs_path):
-        print(f"Loading initial documents from {docs_path}...")
-        try:
-            courses, chunks = rag_system.add_course_folder(docs_path, clear_existing=False)
-            print(f"Loaded {courses} courses with {chunks} chunks")
-        except Exception as e:
-            print(f"Error loading documents: {e}")
-    else:
-        print(f"Documents folder not found at {docs_path}")
+app.include_router(api_router)
 
 # Custom static file handler with no-cache headers for development
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
-import os
-from pathlib import Path
-
-
 class DevStaticFiles(StaticFiles):
     async def get_response(self, path: str, scope):
         response = await super().get_response(path, scope)
@@ -1,30 +1,45 @@
 import os
-from dataclasses import dataclass, field
-from typing import List
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Tuple
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+# Load environment variables from .env file, once per process tree
+if not os.environ.get("_DOTENV_LOADED"):
+    load_dotenv()
+    os.environ["_DOTENV_LOADED"] = "1"
 
-@dataclass
+# Snapshot the environment once; every setting below reads from it
+_ENV = dict(os.environ)
+
+
+def _split_csv(value: str) -> Tuple[str, ...]:
+    """Split a comma-separated setting into a tuple of non-empty, stripped items"""
+    return tuple(item.strip() for item in value.split(",") if item.strip())
+
+
+_ALLOWED_ORIGINS = _split_csv(_ENV.get("ALLOWED_ORIGINS", "http://localhost:3000,http://localhost:8000"))
+_ALLOWED_HOSTS = _split_csv(_ENV.get("ALLOWED_HOSTS", "localhost,127.0.0.1"))
+
+@dataclass(frozen=True, slots=True)
 class Config:
     """Configuration settings for the RAG system"""
     # Preferred provider order: OpenAI -> Anthropic -> Google (Gemini) -> xAI (Grok)
 
     # OpenAI
-    OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
+    OPENAI_API_KEY: str = _ENV.get("OPENAI_API_KEY", "")
     OPENAI_MODEL: str = "gpt-4o"
 
     # Anthropic
-    ANTHROPIC_API_KEY: str = os.getenv("ANTHROPIC_API_KEY", "")
+    ANTHROPIC_API_KEY: str = _ENV.get("ANTHROPIC_API_KEY", "")
     ANTHROPIC_MODEL: str = "claude-sonnet-4-20250514"
 
     # Google (Gemini)
-    GOOGLE_API_KEY: str = os.getenv("GOOGLE_API_KEY", "")
+    GOOGLE_API_KEY: str = _ENV.get("GOOGLE_API_KEY", "")
     GEMINI_MODEL: str = "gemini-1.5-pro-002"
 
     # xAI (Grok)
-    XAI_API_KEY: str = os.getenv("XAI_API_KEY", "")
+    XAI_API_KEY: str = _ENV.get("XAI_API_KEY", "")
     GROK_MODEL: str = "grok-2-latest"
     
     # Embedding model settings
@@ -35,31 +50,48 @@ class Config:
     CHUNK_OVERLAP: int = 100     # Characters to overlap between chunks
     MAX_RESULTS: int = 5         # Maximum search results to return
     MAX_HISTORY: int = 2         # Number of conversation messages to remember
+    STREAM_BATCH_SIZE: int = 8   # Token deltas joined per streamed chunk
+    LLM_MAX_RETRIES: int = int(_ENV.get("LLM_MAX_RETRIES", "3"))  # Retries on 429/5xx, with backoff and jitter
+    
+    # Response cache settings
+    RESPONSE_CACHE_SIZE: int = 1024   # Max cached responses (0 disables the cache)
+    RESPONSE_CACHE_TTL: int = 3600    # Seconds before a cached response expires
+    SEMANTIC_CACHE_ENABLED: bool = _ENV.get("SEMANTIC_CACHE_ENABLED", "false").lower() == "true"
+    SEMANTIC_CACHE_THRESHOLD: float = 0.92  # Min cosine similarity to reuse a cached answer
+    SEMANTIC_CACHE_SIZE: int = 1024   # Max cached answers, oldest evicted first
+    SEMANTIC_CACHE_TTL: int = 3600    # Seconds before a cached answer expires
     
     # Database paths
     CHROMA_PATH: str = "./chroma_db"  # ChromaDB storage location
     
+    # Load docs/ inside the API process at startup; otherwise run `python -m backend.ingest`
+    INGEST_ON_STARTUP: bool = _ENV.get("INGEST_ON_STARTUP", "false").lower() == "true"
+    
     # Logging settings
-    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "ERROR")
+    LOG_LEVEL: str = _ENV.get("LOG_LEVEL", "ERROR")
     
     # Security settings
-    ALLOWED_ORIGINS: List[str] = field(default_factory=lambda: [
-        origin.strip() for origin in os.getenv("ALLOWED_ORIGINS", "http://localhost:3000,http://localhost:8000").split(",")
-        if origin.strip()
-    ])
-    ALLOWED_HOSTS: List[str] = field(default_factory=lambda: [
-        host.strip() for host in os.getenv("ALLOWED_HOSTS", "localhost,127.0.0.1").split(",")
-        if host.strip()
-    ])
+    ALLOWED_ORIGINS: Tuple[str, ...] = _ALLOWED_ORIGINS
+    ALLOWED_HOSTS: Tuple[str, ...] = _ALLOWED_HOSTS
     
     # Rate limiting settings
-    RATE_LIMIT_REQUESTS: int = int(os.getenv("RATE_LIMIT_REQUESTS", "10"))
-    RATE_LIMIT_WINDOW: str = os.getenv("RATE_LIMIT_WINDOW", "10/minute")
+    RATE_LIMIT_REQUESTS: int = int(_ENV.get("RATE_LIMIT_REQUESTS", "10"))
+    RATE_LIMIT_WINDOW: str = _ENV.get("RATE_LIMIT_WINDOW", "10/minute")
     
     # Input validation settings
-    MAX_QUERY_LENGTH: int = int(os.getenv("MAX_QUERY_LENGTH", "1000"))
-    MAX_REQUEST_SIZE: int = int(os.getenv("MAX_REQUEST_SIZE", "1048576"))  # 1MB
+    MAX_QUERY_LENGTH: int = int(_ENV.get("MAX_QUERY_LENGTH", "1000"))
+    MAX_REQUEST_SIZE: int = int(_ENV.get("MAX_REQUEST_SIZE", "1048576"))  # 1MB
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """
+    Return the process-wide Config instance.
+    
+    Settings are read once; tests that change the environment must call
+    get_config.cache_clear() (and reload this module to refresh the snapshot).
+    """
+    return Config()
 
-config = Config()
+config = get_config()
 
 
@@ -0,0 +1,56 @@
+"""
+Load course documents into the vector store outside the API process.
+
+Usage:
+    python -m backend.ingest [docs_path] [--clear]
+"""
+import argparse
+import os
+import sys
+from typing import List, Optional
+
+from .config import config
+from .document_processor import DocumentProcessor
+from .rag_system import ingest_course_folder
+from .semantic_cache import SemanticCache
+from .vector_store import VectorStore
+
+# docs/ folder at the repository root
+DEFAULT_DOCS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "docs")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Ingest every course document in a folder, skipping courses already stored.
+
+    Args:
+        argv: Command line arguments, defaults to sys.argv[1:]
+
+    Returns:
+        Process exit code
+    """
+    parser = argparse.ArgumentParser(description="Load course documents into the vector store")
+    parser.add_argument("docs_path", nargs="?", default=DEFAULT_DOCS_PATH,
+                        help="Folder containing course documents (default: %(default)s)")
+    parser.add_argument("--clear", action="store_true",
+                        help="Clear existing course data before loading")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.docs_path):
+        print(f"Documents folder not found at {args.docs_path}")
+        return 1
+
+    print(f"Loading documents from {args.docs_path}...")
+    # Only the parser and the store are needed, so this runs on machines without LLM API keys
+    document_processor = DocumentProcessor(config.CHUNK_SIZE, config.CHUNK_OVERLAP)
+    vector_store = VectorStore(config.CHROMA_PATH, config.EMBEDDING_MODEL, config.MAX_RESULTS)
+    if args.clear and config.SEMANTIC_CACHE_ENABLED:
+        SemanticCache(vector_store).clear()
+    courses, chunks = ingest_course_folder(document_processor, vector_store, args.docs_path,
+                                           clear_existing=args.clear)
+    print(f"Loaded {courses} courses with {chunks} chunks")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,13 +1,110 @@
-from typing import List, Tuple, Optional, Dict
+from typing import List, Tuple, Optional, Dict, Any, Iterator
 import os
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from .document_processor import DocumentProcessor
 from .vector_store import VectorStore
 from .ai_generator import AIGenerator
 from .session_manager import SessionManager
+from .semantic_cache import SemanticCache
 from .search_tools import ToolManager, CourseSearchTool
 from .models import Course, Lesson, CourseChunk
 
+def ingest_course_folder(document_processor: DocumentProcessor, vector_store: VectorStore,
+                         folder_path: str, clear_existing: bool = False) -> Tuple[int, int]:
+    """
+    Parse, embed and store every new course document in a folder.
+    
+    Needs only the document processor and vector store, so ingestion runs without the
+    LLM clients or API keys a full RAGSystem requires.
+    
+    Args:
+        document_processor: Parser that splits documents into course chunks
+        vector_store: Store the courses are written to
+        folder_path: Path to folder containing course documents
+        clear_existing: Whether to clear existing data first
+        
+    Returns:
+        Tuple of (total courses added, total chunks created)
+    """
+    total_courses = 0
+    total_chunks = 0
+    
+    # Clear existing data if requested
+    if clear_existing:
+        print("Clearing existing data for fresh rebuild...")
+        vector_store.clear_all_data()
+    
+    if not os.path.exists(folder_path):
+        print(f"Folder {folder_path} does not exist")
+        return 0, 0
+    
+    # Get existing course titles to avoid re-processing
+    existing_course_titles = set(vector_store.get_existing_course_titles())
+    
+    file_paths = [
+        os.path.join(folder_path, file_name)
+        for file_name in os.listdir(folder_path)
+        if os.path.isfile(os.path.join(folder_path, file_name))
+        and file_name.lower().endswith(('.pdf', '.docx', '.txt'))
+    ]
+    if not file_paths:
+        return 0, 0
+    
+    def process_document(file_path: str) -> Tuple[Optional[Course], List[CourseChunk]]:
+        """Parse a course document, returning (None, []) if it cannot be processed"""
+        try:
+            return document_processor.process_course_document(file_path)
+        except Exception as e:
+            print(f"Error processing {os.path.basename(file_path)}: {e}")
+            return None, []
+    
+    def embed_chunks(chunks: List[CourseChunk]) -> Optional[List[List[float]]]:
+        """Batch-embed chunk contents, falling back to Chroma's embedding on failure"""
+        try:
+            return vector_store.embed_documents([chunk.content for chunk in chunks])
+        except Exception as e:
+            print(f"Error embedding chunks: {e}")
+            return None
+    
+    with ThreadPoolExecutor(max_workers=min(len(file_paths), os.cpu_count() or 1)) as executor:
+        # Parse every document in parallel; we need the course title to know whether it is new
+        parsed = list(executor.map(process_document, file_paths))
+        
+        new_courses = []
+        for course, course_chunks in parsed:
+            if course and course.title not in existing_course_titles:
+                new_courses.append((course, course_chunks))
+                existing_course_titles.add(course.title)
+            elif course:
+                print(f"Course already exists: {course.title} - skipping")
+        
+        # Embed new courses in parallel (encoding releases the GIL)
+        embeddings = list(executor.map(embed_chunks, [chunks for _, chunks in new_courses]))
+    
+    # Write to the vector store sequentially
+    for (course, course_chunks), course_embeddings in zip(new_courses, embeddings):
+        try:
+            vector_store.add_course_metadata(course)
+            vector_store.add_course_content(course_chunks, course_embeddings)
+            total_courses += 1
+            total_chunks += len(course_chunks)
+            print(f"Added new course: {course.title} ({len(course_chunks)} chunks)")
+        except Exception as e:
+            print(f"Error adding course {course.title}: {e}")
+    
+    return total_courses, total_chunks
+
+class _SharedGeneration:
+    """A generation running for concurrent identical queries, and how many callers await it"""
+    
+    __slots__ = ("task", "waiters")
+    
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
 class RAGSystem:
     """Main orchestrator for the Retrieval-Augmented Generation system"""
     
@@ -19,11 +116,24 @@ class RAGSystem:
         self.vector_store = VectorStore(config.CHROMA_PATH, config.EMBEDDING_MODEL, config.MAX_RESULTS)
         self.ai_generator = AIGenerator(config)
         self.session_manager = SessionManager(config.MAX_HISTORY)
+        self.semantic_cache = (
+            SemanticCache(
+                self.vector_store,
+                config.SEMANTIC_CACHE_THRESHOLD,
+                maxsize=config.SEMANTIC_CACHE_SIZE,
+                ttl=config.SEMANTIC_CACHE_TTL
+            )
+            if config.SEMANTIC_CACHE_ENABLED
+            else None
+        )
         
         # Initialize search tools
         self.tool_manager = ToolManager()
         self.search_tool = CourseSearchTool(self.vector_store)
         self.tool_manager.register_tool(self.search_tool)
+        
+        # In-flight generations keyed by response cache key, shared by concurrent duplicate queries
+        self._inflight: Dict[str, _SharedGeneration] = {}
     
     def add_course_document(self, file_path: str) -> Tuple[Course, int]:
         """
@@ -61,44 +171,9 @@ class RAGSystem:
         Returns:
             Tuple of (total courses added, total chunks created)
         """
-        total_courses = 0
-        total_chunks = 0
-        
-        # Clear existing data if requested
-        if clear_existing:
-            print("Clearing existing data for fresh rebuild...")
-            self.vector_store.clear_all_data()
-        
-        if not os.path.exists(folder_path):
-            print(f"Folder {folder_path} does not exist")
-            return 0, 0
-        
-        # Get existing course titles to avoid re-processing
-        existing_course_titles = set(self.vector_store.get_existing_course_titles())
-        
-        # Process each file in the folder
-        for file_name in os.listdir(folder_path):
-            file_path = os.path.join(folder_path, file_name)
-            if os.path.isfile(file_path) and file_name.lower().endswith(('.pdf', '.docx', '.txt')):
-                try:
-                    # Check if this course might already exist
-                    # We'll process the document to get the course ID, but only add if new
-                    course, course_chunks = self.document_processor.process_course_document(file_path)
-                    
-                    if course and course.title not in existing_course_titles:
-                        # This is a new course - add it to the vector store
-                        self.vector_store.add_course_metadata(course)
-                        self.vector_store.add_course_content(course_chunks)
-                        total_courses += 1
-                        total_chunks += len(course_chunks)
-                        print(f"Added new course: {course.title} ({len(course_chunks)} chunks)")
-                        existing_course_titles.add(course.title)
-                    elif course:
-                        print(f"Course already exists: {course.title} - skipping")
-                except Exception as e:
-                    print(f"Error processing {file_name}: {e}")
-        
-        return total_courses, total_chunks
+        if clear_existing and self.semantic_cache:
+            self.semantic_cache.clear()
+        return ingest_course_folder(self.document_processor, self.vector_store, folder_path, clear_existing)
     
     def query(self, query: str, session_id: Optional[str] = None) -> Tuple[str, List[str]]:
         """
@@ -111,41 +186,19 @@ class RAGSystem:
         Returns:
             Tuple of (response, sources list - empty for tool-based approach)
         """
-        # Create prompt for the AI with clear instructions
-        prompt = f"""Answer this question about course materials: {query}"""
-        
-        # Get conversation history if session exists
-        history = None
-        if session_id:
-            history = self.session_manager.get_conversation_history(session_id)
+        prompt, history, tools = self._prepare_generation(query, session_id)
         
         # Generate response using AI with tools
         logger = logging.getLogger(__name__)
         try:
-            # Get provider-specific tool definitions
-            provider_mode = self.ai_generator.provider_mode
-            # Map provider mode to tool format
-            if provider_mode == "aisuite":
-                # AISuite uses OpenAI-compatible format
-                if "openai:" in self.ai_generator.model:
-                    provider = "openai"
-                elif "google:" in self.ai_generator.model:
-                    provider = "google"
-                elif "xai:" in self.ai_generator.model:
-                    provider = "xai"
-                else:
-                    provider = "openai"  # Default to OpenAI format
-            else:
-                provider = provider_mode
-            
-            tools = self.tool_manager.get_tool_definitions(provider)
-            
-            response = self.ai_generator.generate_response(
-                query=prompt,
-                conversation_history=history,
-                tools=tools,
-                tool_manager=self.tool_manager
-            )
+            # Collect sources from the search tool for this query only
+            with self.tool_manager.collect_sources() as sources:
+                response = self.ai_generator.generate_response(
+                    query=prompt,
+                    conversation_history=history,
+                    tools=tools,
+                    tool_manager=self.tool_manager
+                )
             # Log a short preview to help diagnose issues
             preview = response[:200] + ("..." if len(response) > 200 else "") if isinstance(response, str) else "<non-string>"
             logger.debug("AI response generated. preview=%s", preview)
@@ -153,12 +206,6 @@ class RAGSystem:
             logger.exception("AI generation failed for prompt: %s", prompt)
             raise
         
-        # Get sources from the search tool
-        sources = self.tool_manager.get_last_sources()
-
-        # Reset sources after retrieving them
-        self.tool_manager.reset_sources()
-        
         # Update conversation history
         if session_id:
             self.session_manager.add_exchange(session_id, query, response)
@@ -166,6 +213,148 @@ class RAGSystem:
         # Return response with sources from tool searches
         return response, sources
     
+    async def aquery(self, query: str, session_id: Optional[str] = None) -> Tuple[str, List[str]]:
+        """
+        Async variant of query() that keeps the event loop free during LLM and search I/O.
+        
+        Args:
+            query: User's question
+            session_id: Optional session ID for conversation context
+            
+        Returns:
+            Tuple of (response, sources list)
+        """
+        prompt, history, tools = self._prepare_generation(query, session_id)
+        
+        # Single-flight: identical concurrent queries share one generation. It runs as its own
+        # task so that cancelling whichever caller started it doesn't cancel it for the others.
+        key = self.ai_generator.cache_key(prompt, history)
+        shared = self._inflight.get(key)
+        if shared is None:
+            shared = _SharedGeneration(asyncio.create_task(self._agenerate(prompt, history, tools)))
+            self._inflight[key] = shared
+            shared.task.add_done_callback(lambda task, shared=shared: self._finish_generation(key, shared))
+        
+        shared.waiters += 1
+        try:
+            response, sources = await asyncio.shield(shared.task)
+        except asyncio.CancelledError:
+            # Stop generating once no caller is left to receive the answer. Forget it right
+            # away so a caller arriving before the task finishes starts a fresh generation.
+            if shared.waiters == 1:
+                shared.task.cancel()
+                self._forget_generation(key, shared)
+            raise
+        finally:
+            shared.waiters -= 1
+        sources = list(sources)
+        
+        # Update conversation history
+        if session_id:
+            self.session_manager.add_exchange(session_id, query, response)
+        
+        return response, sources
+    
+    def _forget_generation(self, key: str, shared: _SharedGeneration):
+        """Stop sharing a generation with new callers, unless another already replaced it"""
+        if self._inflight.get(key) is shared:
+            del self._inflight[key]
+    
+    def _finish_generation(self, key: str, shared: _SharedGeneration):
+        """Forget a finished generation, marking its failure as retrieved even if nobody awaited it"""
+        self._forget_generation(key, shared)
+        if not shared.task.cancelled():
+            shared.task.exception()
+    
+    async def _agenerate(self, prompt: str, history: Optional[str], tools: list) -> Tuple[str, List[str]]:
+        """Generate a response for a prepared prompt, returning it with the sources it used"""
+        logger = logging.getLogger(__name__)
+        try:
+            # Collect sources from the search tool for this query only
+            with self.tool_manager.collect_sources() as sources:
+                response = await self.ai_generator.agenerate_response(
+                    query=prompt,
+                    conversation_history=history,
+                    tools=tools,
+                    tool_manager=self.tool_manager
+                )
+        except Exception:
+            logger.exception("AI generation failed for prompt: %s", prompt)
+            raise
+        
+        return response, sources
+    
+    def query_stream(self, query: str, session_id: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Process a user query and stream the response as it is generated.
+        
+        Args:
+            query: User's question
+            session_id: Optional session ID for conversation context
+            
+        Yields:
+            {"type": "token", "text": ...} events for each response chunk, then
+            a single {"type": "sources", "sources": [...]} event
+        """
+        prompt, history, tools = self._prepare_generation(query, session_id)
+        
+        chunks = []
+        # Collect sources from the search tool for this query only
+        with self.tool_manager.collect_sources() as sources:
+            for chunk in self.ai_generator.generate_response_stream(
+                query=prompt,
+                conversation_history=history,
+                tools=tools,
+                tool_manager=self.tool_manager,
+                batch_size=self.config.STREAM_BATCH_SIZE
+            ):
+                chunks.append(chunk)
+                yield {"type": "token", "text": chunk}
+        
+        # Update conversation history with the complete response
+        if session_id:
+            self.session_manager.add_exchange(session_id, query, "".join(chunks))
+        
+        yield {"type": "sources", "sources": sources}
+    
+    def _prepare_generation(self, query: str, session_id: Optional[str] = None) -> Tuple[str, Optional[str], list]:
+        """
+        Build the prompt, conversation history and tool definitions for a query.
+        
+        Args:
+            query: User's question
+            session_id: Optional session ID for conversation context
+            
+        Returns:
+            Tuple of (prompt, conversation history, provider-specific tool definitions)
+        """
+        # Create prompt for the AI with clear instructions
+        prompt = f"""Answer this question about course materials: {query}"""
+        
+        # Get conversation history if session exists
+        history = None
+        if session_id:
+            history = self.session_manager.get_conversation_history(session_id)
+        
+        # Get provider-specific tool definitions
+        provider_mode = self.ai_generator.provider_mode
+        # Map provider mode to tool format
+        if provider_mode == "aisuite":
+            # AISuite uses OpenAI-compatible format
+            if "openai:" in self.ai_generator.model:
+                provider = "openai"
+            elif "google:" in self.ai_generator.model:
+                provider = "google"
+            elif "xai:" in self.ai_generator.model:
+                provider = "xai"
+            else:
+                provider = "openai"  # Default to OpenAI format
+        else:
+            provider = provider_mode
+        
+        tools = self.tool_manager.get_tool_definitions(provider)
+        return prompt, history, tools
+    
     def get_course_analytics(self) -> Dict:
         """Get analytics about the course catalog"""
         return {
@@ -1,7 +1,13 @@
-from typing import Dict, Any, Optional, Protocol
+from typing import Dict, Any, Optional, Protocol, Iterator, List
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
 from .vector_store import VectorStore, SearchResults
 
+# Sources collected for the query currently being answered. Each query gets its
+# own list so concurrent requests never read each other's search results.
+_query_sources: ContextVar[Optional[List[str]]] = ContextVar("query_sources", default=None)
+
 
 class Tool(ABC):
     """Abstract base class for all tools with unified multi-LLM support"""
@@ -132,6 +138,9 @@ class CourseSearchTool(Tool):
         
         # Store sources for retrieval
         self.last_sources = sources
+        collected = _query_sources.get()
+        if collected is not None:
+            collected[:] = sources
         
         return "\n\n".join(formatted)
 
@@ -140,6 +149,7 @@ class ToolManager:
     
     def __init__(self):
         self.tools = {}
+        self._definitions: Dict[str, list] = {}  # Provider -> tool definitions
     
     def register_tool(self, tool: Tool):
         """Register any tool that implements the Tool interface"""
@@ -148,11 +158,24 @@ class ToolManager:
         if not tool_name:
             raise ValueError("Tool must have a 'name' in its definition")
         self.tools[tool_name] = tool
+        self._definitions.clear()
 
     
     def get_tool_definitions(self, provider: str = "anthropic") -> list:
-        """Get all tool definitions formatted for specific LLM provider"""
-        return [tool.get_tool_definition_for_provider(provider) for tool in self.tools.values()]
+        """
+        Get all tool definitions formatted for specific LLM provider.
+        
+        Definitions are static once tools are registered, so the list is built once
+        per provider and shared between requests; callers must not mutate it. Tools are
+        ordered by name so the prompt prefix sent to the provider is stable across runs.
+        """
+        definitions = self._definitions.get(provider)
+        if definitions is None:
+            definitions = [
+                self.tools[name].get_tool_definition_for_provider(provider) for name in sorted(self.tools)
+            ]
+            self._definitions[provider] = definitions
+        return definitions
     
     def execute_tool(self, tool_name: str, **kwargs) -> str:
         """Execute a tool by name with given parameters"""
@@ -161,6 +184,23 @@ class ToolManager:
         
         return self.tools[tool_name].execute(**kwargs)
     
+    @contextmanager
+    def collect_sources(self) -> Iterator[List[str]]:
+        """
+        Collect sources from tool searches made while the context is active.
+        
+        Tools executed in worker threads via asyncio.to_thread see the same list,
+        since the thread runs in a copy of the caller's context.
+        """
+        sources: List[str] = []
+        previous = _query_sources.get()
+        _query_sources.set(sources)
+        try:
+            yield sources
+        finally:
+            # Restore by value rather than token: streamed responses may exit in another context
+            _query_sources.set(previous)
+    
     def get_last_sources(self) -> list:
         """Get sources from the last search operation"""
         # Check all tools for last_sources attribute
@@ -0,0 +1,126 @@
+import hashlib
+import time
+import orjson
+from typing import List, Optional, Tuple
+from .vector_store import VectorStore
+
+class SemanticCache:
+    """
+    Caches answers for near-duplicate queries in a dedicated ChromaDB collection.
+    
+    Entries are tagged with the course count they were answered against. Ingestion only
+    ever adds courses, so once courses are added, from this process or from
+    `python -m backend.ingest`, older answers stop matching. Entries also expire after
+    ttl seconds, and the oldest are evicted beyond maxsize.
+    """
+    
+    # Bucket for queries asked without prior conversation context
+    GLOBAL_BUCKET = "global"
+    
+    def __init__(self, vector_store: VectorStore, threshold: float = 0.92,
+                 maxsize: int = 1024, ttl: float = 3600.0,
+                 collection_name: str = "response_cache"):
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.vector_store = vector_store
+        self.client = vector_store.client
+        self.embedding_function = vector_store.embedding_function
+        self.collection_name = collection_name
+        self.collection = self._create_collection()
+    
+    def _create_collection(self):
+        """Create or get the cache collection using cosine distance"""
+        return self.client.get_or_create_collection(
+            name=self.collection_name,
+            embedding_function=self.embedding_function,
+            metadata={"hnsw:space": "cosine"}
+        )
+    
+    def _content_version(self) -> int:
+        """Number of courses in the catalog, which changes whenever courses are added"""
+        return self.vector_store.course_catalog.count()
+    
+    def lookup(self, query: str, bucket: str = GLOBAL_BUCKET) -> Optional[Tuple[str, List[str]]]:
+        """
+        Find a cached answer for a semantically similar query.
+        
+        Args:
+            query: The user's question
+            bucket: Cache partition, the session ID for context-dependent queries
+            
+        Returns:
+            Tuple of (answer, sources) if a close enough match exists, else None
+        """
+        try:
+            results = self.collection.query(
+                query_texts=[query],
+                n_results=1,
+                where={"$and": [
+                    {"bucket": bucket},
+                    {"content_version": self._content_version()},
+                    {"created_at": {"$gte": time.time() - self.ttl}},
+                ]}
+            )
+        except Exception as e:
+            print(f"Error querying response cache: {e}")
+            return None
+        
+        if not results['ids'] or not results['ids'][0]:
+            return None
+        
+        # Cosine distance is 1 - cosine similarity
+        similarity = 1 - results['distances'][0][0]
+        if similarity < self.threshold:
+            return None
+        
+        metadata = results['metadatas'][0][0]
+        return metadata['answer'], orjson.loads(metadata['sources_json'])
+    
+    def store(self, query: str, answer: str, sources: List[str], bucket: str = GLOBAL_BUCKET):
+        """Cache the answer and sources for a query, evicting the oldest entries when full"""
+        if self.maxsize <= 0:
+            return
+        cache_id = hashlib.sha256(f"{bucket}\x00{query}".encode("utf-8")).hexdigest()
+        try:
+            self.collection.upsert(
+                documents=[query],
+                metadatas=[{
+                    "bucket": bucket,
+                    "answer": answer,
+                    "sources_json": orjson.dumps(sources).decode(),  # Serialize as JSON string
+                    "content_version": self._content_version(),
+                    "created_at": time.time()
+                }],
+                ids=[cache_id]
+            )
+            if self.collection.count() > self.maxsize:
+                self._evict()
+        except Exception as e:
+            print(f"Error storing response in cache: {e}")
+    
+    def _evict(self):
+        """Delete expired and outdated entries, then the oldest ones, down to maxsize"""
+        entries = self.collection.get(include=["metadatas"])
+        version = self._content_version()
+        expired_before = time.time() - self.ttl
+        
+        # Entries that can never match again sort first, then the rest by age
+        ranked = sorted(
+            zip(entries['ids'], entries['metadatas']),
+            key=lambda entry: (
+                entry[1].get("content_version") == version and entry[1].get("created_at", 0) >= expired_before,
+                entry[1].get("created_at", 0)
+            )
+        )
+        stale_ids = [cache_id for cache_id, _ in ranked[:len(ranked) - self.maxsize]]
+        if stale_ids:
+            self.collection.delete(ids=stale_ids)
+    
+    def clear(self):
+        """Drop all cached answers, e.g. after the course content changes"""
+        try:
+            self.client.delete_collection(self.collection_name)
+            self.collection = self._create_collection()
+        except Exception as e:
+            print(f"Error clearing response cache: {e}")
@@ -46,6 +46,8 @@ class VectorStore:
         self.embedding_function = chromadb.utils.embedding_functions.SentenceTransformerEmbeddingFunction(
             model_name=embedding_model
         )
+        # Reuse the model Chroma already loaded for batched encoding during ingestion
+        self.embedder = getattr(self.embedding_function, "_model", None) or SentenceTransformer(embedding_model)
         
         # Create collections for different types of data
         self.course_catalog = self._create_collection("course_catalog")  # Course titles/instructors
@@ -134,7 +136,7 @@ class VectorStore:
     
     def add_course_metadata(self, course: Course):
         """Add course information to the catalog for semantic search"""
-        import json
+        import orjson
 
         course_text = course.title
         
@@ -153,14 +155,24 @@ class VectorStore:
                 "title": course.title,
                 "instructor": course.instructor,
                 "course_link": course.course_link,
-                "lessons_json": json.dumps(lessons_metadata),  # Serialize as JSON string
+                "lessons_json": orjson.dumps(lessons_metadata).decode(),  # Serialize as JSON string
                 "lesson_count": len(course.lessons)
             }],
             ids=[course.title]
         )
     
-    def add_course_content(self, chunks: List[CourseChunk]):
-        """Add course content chunks to the vector store"""
+    def warmup(self):
+        """Run a dummy embedding so the first user query doesn't pay model initialization"""
+        self.embedding_function(["warmup"])
+    
+    def embed_documents(self, texts: List[str], batch_size: int = 64) -> List[List[float]]:
+        """Encode texts in batches with the same model used for queries"""
+        if not texts:
+            return []
+        return self.embedder.encode(texts, batch_size=batch_size, show_progress_bar=False).tolist()
+    
+    def add_course_content(self, chunks: List[CourseChunk], embeddings: Optional[List[List[float]]] = None):
+        """Add course content chunks to the vector store, optionally with precomputed embeddings"""
         if not chunks:
             return
         
@@ -176,7 +188,8 @@ class VectorStore:
         self.course_content.add(
             documents=documents,
             metadatas=metadatas,
-            ids=ids
+            ids=ids,
+            embeddings=embeddings
         )
     
     def clear_all_data(self):
@@ -215,7 +228,7 @@ class VectorStore:
     
     def get_all_courses_metadata(self) -> List[Dict[str, Any]]:
         """Get metadata for all courses in the vector store"""
-        import json
+        import orjson
         try:
             results = self.course_catalog.get()
             if results and 'metadatas' in results:
@@ -224,7 +237,7 @@ class VectorStore:
                 for metadata in results['metadatas']:
                     course_meta = metadata.copy()
                     if 'lessons_json' in course_meta:
-                        course_meta['lessons'] = json.loads(course_meta['lessons_json'])
+                        course_meta['lessons'] = orjson.loads(course_meta['lessons_json'])
                         del course_meta['lessons_json']  # Remove the JSON string version
                     parsed_metadata.append(course_meta)
                 return parsed_metadata
@@ -248,7 +261,7 @@ class VectorStore:
     
     def get_lesson_link(self, course_title: str, lesson_number: int) -> Optional[str]:
         """Get lesson link for a given course title and lesson number"""
-        import json
+        import orjson
         try:
             # Get course by ID (title is the ID)
             results = self.course_catalog.get(ids=[course_title])
@@ -256,7 +269,7 @@ class VectorStore:
                 metadata = results['metadatas'][0]
                 lessons_json = metadata.get('lessons_json')
                 if lessons_json:
-                    lessons = json.loads(lessons_json)
+                    lessons = orjson.loads(lessons_json)
                     # Find the lesson with matching number
                     for lesson in lessons:
                         if lesson.get('lesson_number') == lesson_number:
@@ -3,200 +3,198 @@
 Comprehensive browser test for RAG chatbot functionality and security
 """
 import asyncio
-from playwright.async_api import async_playwright
+import pytest
+from tests._browser_helpers import (
+    ASSISTANT_SEL, BASE_URL, assert_chat_ready, check_security_headers, launch_app_context, open_app,
+    wait_for_course_stats
+)
 
-async def comprehensive_test():
+# Share the session-scoped browser fixtures from conftest.py
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+@pytest.mark.serial
+@pytest.mark.usefixtures("server_process", "reset_rate_limits")
+async def test_comprehensive(context, api):
     print("🧪 Comprehensive Browser Test Starting...")
     print("="*60)
     
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        page = await browser.new_page()
-        
-        # Test 1: Basic Page Load
-        print("\n1. 📄 Testing Basic Page Load")
-        print("-" * 30)
-        await page.goto("http://127.0.0.1:8000")
-        
-        title = await page.title()
-        heading = await page.locator("h1").text_content()
-        print(f"✅ Title: {title}")
-        print(f"✅ Heading: {heading}")
-        assert "Course Materials Assistant" in title
-        assert "Course Materials Assistant" in heading
-        
-        # Test 2: Course Statistics
-        print("\n2. 📊 Testing Course Statistics")
-        print("-" * 30)
-        await page.wait_for_timeout(3000)  # Let JS load
-        
-        total_courses = page.locator("#totalCourses")
-        course_count = await total_courses.text_content()
-        print(f"✅ Total courses loaded: {course_count}")
-        
-        course_titles = page.locator("#courseTitles .course-title-item")
-        titles_count = await course_titles.count()
-        print(f"✅ Course titles displayed: {titles_count}")
-        
-        # Test 3: Chat Interface Elements
-        print("\n3. 💬 Testing Chat Interface")
-        print("-" * 30)
-        
-        # Check welcome message (with timeout handling)
-        welcome = page.locator(".welcome-message")
-        try:
-            await welcome.wait_for(timeout=5000)  # Wait up to 5 seconds
-            welcome_text = await welcome.text_content()
-            print(f"✅ Welcome message: {welcome_text[:50]}...")
-        except:
-            # Check if there's any message in chat
-            all_messages = page.locator(".message")
-            message_count = await all_messages.count()
-            print(f"⚠️  Welcome message not found, but {message_count} messages present")
-        
-        # Check input elements
-        chat_input = page.locator("#chatInput")
-        send_button = page.locator("#sendButton")
-        assert await chat_input.is_visible()
-        assert await send_button.is_visible()
-        print("✅ Chat input and button visible")
-        
-        # Check suggested questions
-        suggested = page.locator(".suggested-item")
-        suggested_count = await suggested.count()
-        print(f"✅ Suggested questions: {suggested_count}")
-        
-        # Test 4: Valid Query Functionality
-        print("\n4. 🔍 Testing Valid Query")
-        print("-" * 30)
-        
-        test_query = "What courses are available?"
-        await page.fill("#chatInput", test_query)
-        await page.click("#sendButton")
-        
-        # Wait for response
-        await page.wait_for_selector(".message.assistant:not(.welcome-message)", timeout=30000)
-        
-        # Check messages
-        user_messages = await page.locator('.message.user').count()
-        assistant_messages = await page.locator('.message.assistant:not(.welcome-message)').count()
-        
-        print(f"✅ User messages: {user_messages}")
-        print(f"✅ Assistant responses: {assistant_messages}")
-        
-        # Get actual response text content
-        last_response = page.locator('.message.assistant:not(.welcome-message)').last
-        response_text = await last_response.text_content()
-        clean_response = ' '.join(response_text.split())  # Clean whitespace
-        print(f"✅ Response preview: {clean_response[:80]}...")
-        
-        # Test 5: Input Validation
-        print("\n5. 🛡️  Testing Input Validation")
-        print("-" * 30)
-        
-        # Test long input (over limit)
-        long_query = "A" * 1500  # Over the 1000 char limit
-        await page.fill("#chatInput", long_query)
-        await page.click("#sendButton")
-        
-        # Wait for validation response
-        await page.wait_for_timeout(5000)
-        
-        # Check if error was handled (should show validation error in UI)
-        print("✅ Long input test completed")
-        
-        # Test 6: Suggested Questions
-        print("\n6. ❓ Testing Suggested Questions")
-        print("-" * 30)
-        
-        # Clear input and test suggested question
-        await page.fill("#chatInput", "")
-        first_suggested = page.locator(".suggested-item").first
-        if await first_suggested.count() > 0:
-            await first_suggested.click()
-            input_value = await page.input_value("#chatInput")
-            print(f"✅ Suggested question filled: '{input_value}'")
+    # Test 1: Basic Page Load
+    print("\n1. 📄 Testing Basic Page Load")
+    print("-" * 30)
+    page = await open_app(context)
+    
+    title = await page.title()
+    heading = await page.locator("h1").text_content()
+    print(f"✅ Title: {title}")
+    print(f"✅ Heading: {heading}")
+    assert "Course Materials Assistant" in title
+    assert "Course Materials Assistant" in heading
+    
+    # Test 2: Course Statistics
+    print("\n2. 📊 Testing Course Statistics")
+    print("-" * 30)
+    await wait_for_course_stats(page)
+    
+    total_courses = page.locator("#totalCourses")
+    course_count = await total_courses.text_content()
+    print(f"✅ Total courses loaded: {course_count}")
+    
+    course_titles = page.locator("#courseTitles .course-title-item")
+    titles_count = await course_titles.count()
+    print(f"✅ Course titles displayed: {titles_count}")
+    
+    # Test 3: Chat Interface Elements
+    print("\n3. 💬 Testing Chat Interface")
+    print("-" * 30)
+    
+    # Check welcome message (with timeout handling)
+    welcome = page.locator(".welcome-message")
+    try:
+        await welcome.wait_for(timeout=5000)  # Wait up to 5 seconds
+        welcome_text = await welcome.text_content()
+        print(f"✅ Welcome message: {welcome_text[:50]}...")
+    except:
+        # Check if there's any message in chat
+        all_messages = page.locator(".message")
+        message_count = await all_messages.count()
+        print(f"⚠️  Welcome message not found, but {message_count} messages present")
+    
+    # Check input elements
+    await assert_chat_ready(page)
+    print("✅ Chat input and button visible")
+    
+    # Check suggested questions
+    suggested = page.locator(".suggested-item")
+    suggested_count = await suggested.count()
+    print(f"✅ Suggested questions: {suggested_count}")
+    
+    # Test 4: Valid Query Functionality
+    print("\n4. 🔍 Testing Valid Query")
+    print("-" * 30)
+    
+    test_query = "What courses are available?"
+    await page.fill("#chatInput", test_query)
+    await page.click("#sendButton")
+    
+    # Wait for response
+    await page.wait_for_selector(ASSISTANT_SEL, timeout=30000)
+    
+    # Check messages
+    user_messages = await page.locator('.message.user').count()
+    assistant_messages = await page.locator(ASSISTANT_SEL).count()
+    
+    print(f"✅ User messages: {user_messages}")
+    print(f"✅ Assistant responses: {assistant_messages}")
+    
+    # Get actual response text content
+    last_response = page.locator(ASSISTANT_SEL).last
+    response_text = await last_response.text_content()
+    clean_response = ' '.join(response_text.split())  # Clean whitespace
+    print(f"✅ Response preview: {clean_response[:80]}...")
+    
+    # Test 5: Input Validation
+    print("\n5. 🛡️  Testing Input Validation")
+    print("-" * 30)
+    
+    # Test long input (over limit)
+    long_query = "A" * 1500  # Over the 1000 char limit
+    await page.fill("#chatInput", long_query)
+    await page.click("#sendButton")
+    
+    # Wait for validation response; the input is re-enabled once the request settles
+    await page.wait_for_selector("#chatInput:enabled", timeout=10000)
+    
+    # Check if error was handled (should show validation error in UI)
+    print("✅ Long input test completed")
+    
+    # Test 6: Suggested Questions
+    print("\n6. ❓ Testing Suggested Questions")
+    print("-" * 30)
+    
+    # Clear input and test suggested question
+    await page.fill("#chatInput", "")
+    first_suggested = page.locator(".suggested-item").first
+    if await first_suggested.count() > 0:
+        await first_suggested.click()
+        input_value = await page.input_value("#chatInput")
+        print(f"✅ Suggested question filled: '{input_value}'")
+    else:
+        print("⚠️  No suggested questions found")
+    
+    # Test 7: Security Headers
+    print("\n7. 🔒 Testing Security Headers")
+    print("-" * 30)
+    
+    for header, valid in (await check_security_headers(api)).items():
+        if valid:
+            print(f"✅ {header}: OK")
         else:
-            print("⚠️  No suggested questions found")
-        
-        # Test 7: Security Headers
-        print("\n7. 🔒 Testing Security Headers")
-        print("-" * 30)
-        
-        response = await page.goto("http://127.0.0.1:8000/health")
-        headers = response.headers
-        
-        security_checks = {
-            'x-content-type-options': 'nosniff',
-            'x-frame-options': 'DENY',
-            'x-xss-protection': '1; mode=block',
-            'content-security-policy': 'default-src',
-            'strict-transport-security': 'max-age'
-        }
-        
-        for header, expected in security_checks.items():
-            if header in headers and expected in headers[header]:
-                print(f"✅ {header}: {headers[header][:30]}...")
-            else:
-                print(f"❌ Missing or invalid {header}")
-        
-        # Test 8: Responsive Design
-        print("\n8. 📱 Testing Responsive Design")
-        print("-" * 30)
-        
-        # Test mobile view
-        await page.set_viewport_size({"width": 375, "height": 667})
-        await page.goto("http://127.0.0.1:8000")
-        
-        mobile_chat_input = page.locator("#chatInput")
-        mobile_send_button = page.locator("#sendButton")
-        
-        assert await mobile_chat_input.is_visible()
-        assert await mobile_send_button.is_visible()
-        print("✅ Mobile viewport: Chat elements visible")
-        
-        # Test desktop view
-        await page.set_viewport_size({"width": 1920, "height": 1080})
-        await page.goto("http://127.0.0.1:8000")
-        
-        desktop_sidebar = page.locator(".sidebar")
-        assert await desktop_sidebar.is_visible()
-        print("✅ Desktop viewport: Sidebar visible")
-        
-        # Test 9: API Endpoints Direct Access
-        print("\n9. 🔌 Testing API Endpoints")
-        print("-" * 30)
-        
-        # Test courses API
-        courses_response = await page.goto("http://127.0.0.1:8000/api/courses")
-        print(f"✅ Courses API: {courses_response.status}")
-        
-        # Test health API
-        health_response = await page.goto("http://127.0.0.1:8000/health")
-        print(f"✅ Health API: {health_response.status}")
-        
-        await browser.close()
-        
-        # Final Summary
-        print("\n" + "="*60)
-        print("🎉 COMPREHENSIVE BROWSER TEST RESULTS")
-        print("="*60)
-        print("✅ Page Loading: PASSED")
-        print("✅ Course Statistics: PASSED") 
-        print("✅ Chat Interface: PASSED")
-        print("✅ Query Functionality: PASSED")
-        print("✅ Input Validation: PASSED")
-        print("✅ Suggested Questions: PASSED")
-        print("✅ Security Headers: PASSED")
-        print("✅ Responsive Design: PASSED")
-        print("✅ API Endpoints: PASSED")
-        print("\n🛡️  SECURITY FEATURES VERIFIED:")
-        print("   • CORS Protection Active")
-        print("   • Rate Limiting Working") 
-        print("   • Input Validation Active")
-        print("   • Security Headers Present")
-        print("   • Error Handling Secure")
-        print("\n🚀 ALL TESTS PASSED - READY FOR PRODUCTION!")
+            print(f"❌ Missing or invalid {header}")
+    
+    # Test 8: Responsive Design
+    print("\n8. 📱 Testing Responsive Design")
+    print("-" * 30)
+    
+    # Open a mobile page from the shared context; the already-loaded page covers desktop
+    mobile_page = await context.new_page()
+    await asyncio.gather(
+        mobile_page.set_viewport_size({"width": 375, "height": 667}),
+        page.set_viewport_size({"width": 1920, "height": 1080})
+    )
+    await mobile_page.goto(BASE_URL)
+    
+    # Check mobile chat elements and the desktop sidebar together
+    mobile_input_ok, mobile_send_ok, desktop_sidebar_ok = await asyncio.gather(
+        mobile_page.locator("#chatInput").is_visible(),
+        mobile_page.locator("#sendButton").is_visible(),
+        page.locator(".sidebar").is_visible()
+    )
+    
+    assert mobile_input_ok and mobile_send_ok
+    print("✅ Mobile viewport: Chat elements visible")
+    
+    assert desktop_sidebar_ok
+    print("✅ Desktop viewport: Sidebar visible")
+    await mobile_page.close()
+    
+    # Test 9: API Endpoints Direct Access
+    print("\n9. 🔌 Testing API Endpoints")
+    print("-" * 30)
+    
+    # Test courses and health APIs concurrently
+    courses_response, health_response = await asyncio.gather(
+        api.get("/api/courses"),
+        api.get("/health")
+    )
+    print(f"✅ Courses API: {courses_response.status}")
+    print(f"✅ Health API: {health_response.status}")
+    
+    await page.close()
+    
+    # Final Summary
+    print("\n" + "="*60)
+    print("🎉 COMPREHENSIVE BROWSER TEST RESULTS")
+    print("="*60)
+    print("✅ Page Loading: PASSED")
+    print("✅ Course Statistics: PASSED") 
+    print("✅ Chat Interface: PASSED")
+    print("✅ Query Functionality: PASSED")
+    print("✅ Input Validation: PASSED")
+    print("✅ Suggested Questions: PASSED")
+    print("✅ Security Headers: PASSED")
+    print("✅ Responsive Design: PASSED")
+    print("✅ API Endpoints: PASSED")
+    print("\n🛡️  SECURITY FEATURES VERIFIED:")
+    print("   • CORS Protection Active")
+    print("   • Rate Limiting Working") 
+    print("   • Input Validation Active")
+    print("   • Security Headers Present")
+    print("   • Error Handling Secure")
+    print("\n🚀 ALL TESTS PASSED - READY FOR PRODUCTION!")
+
+async def main():
+    async with launch_app_context() as (context, api):
+        await test_comprehensive(context, api)
 
 if __name__ == "__main__":
-    asyncio.run(comprehensive_test())
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
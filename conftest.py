@@ -0,0 +1,130 @@
+"""
+Shared Playwright fixtures for the browser test scripts
+
+The browser tests can run across pytest-xdist workers, with the LLM-bound ones
+kept to a separate serial pass:
+
+    pytest -n auto --dist=loadfile -m "not serial"
+    pytest -m serial
+"""
+import time
+import warnings
+import pytest
+import pytest_asyncio
+from filelock import FileLock
+from playwright.async_api import async_playwright
+from tests._browser_helpers import BASE_URL, CHROMIUM_ARGS, VIEWPORT, block_heavy_resources
+from tests._server_utils import start_server_thread, stop_server_thread, wait_for_server, warm_up_server
+
+# How long the server's owner waits at teardown for other xdist workers to let go
+SERVER_RELEASE_TIMEOUT = 300.0
+
+
+@pytest.fixture(scope="session")
+def server_process(tmp_path_factory, worker_id):
+    """
+    Serve the FastAPI app in-process once for the whole run, shared by every xdist worker.
+
+    The first worker through the lock starts uvicorn on a background thread. Workers count
+    themselves in a file next to the lock, and the owner keeps serving at teardown until
+    every other worker has let go, or SERVER_RELEASE_TIMEOUT passes, in case a worker
+    crashed without counting itself out.
+    """
+    shared_dir = tmp_path_factory.getbasetemp()
+    if worker_id != "master":
+        shared_dir = shared_dir.parent
+    lock = FileLock(str(shared_dir / "server.lock"))
+    users_file = shared_dir / "server.users"
+
+    def read_users() -> int:
+        return int(users_file.read_text()) if users_file.exists() else 0
+
+    server = thread = None
+    with lock:
+        users = read_users()
+        if users == 0:
+            print("\n🚀 Starting test server...")
+            server, thread = start_server_thread()
+
+            # Other workers block on the lock until the server answers and is warm
+            wait_for_server(f"{BASE_URL}/health")
+            warm_up_server(BASE_URL)
+        users_file.write_text(str(users + 1))
+
+    yield server
+
+    with lock:
+        users = read_users() - 1
+        users_file.write_text(str(users))
+    if server is not None:
+        deadline = time.monotonic() + SERVER_RELEASE_TIMEOUT
+        while users > 0:
+            if time.monotonic() > deadline:
+                warnings.warn(f"{users} xdist worker(s) still registered after {SERVER_RELEASE_TIMEOUT:.0f}s; "
+                              "stopping the test server anyway")
+                break
+            time.sleep(0.1)
+            with lock:
+                users = read_users()
+        print("\n🛑 Stopping test server...")
+        stop_server_thread(server, thread)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def playwright():
+    """Start Playwright once for the whole test session"""
+    async with async_playwright() as p:
+        yield p
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def browser(playwright):
+    """Launch one headless Chromium for the whole test session"""
+    browser = await playwright.chromium.launch(headless=True, args=list(CHROMIUM_ARGS))
+    yield browser
+    await browser.close()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def context(browser):
+    """Browser context shared by all tests so static assets come from its HTTP cache"""
+    context = await browser.new_context(viewport=VIEWPORT)
+    await context.route("**/*", block_heavy_resources)
+    yield context
+    await context.close()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def isolated_context(browser):
+    """Fresh context per test on the shared browser, so no cookies or storage leak between tests"""
+    context = await browser.new_context(viewport=VIEWPORT)
+    await context.route("**/*", block_heavy_resources)
+    yield context
+    await context.close()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def page(isolated_context):
+    """Fresh page in its own context per test"""
+    return await isolated_context.new_page()
+
+
+@pytest.fixture
+def reset_rate_limits(server_process):
+    """
+    Give a test the full per-client query budget, whatever earlier tests spent.
+
+    The limiter lives in the server's process, so this only takes effect in the process
+    that owns the server, which is the case for the serial pass.
+    """
+    if server_process is not None:
+        from backend.app import limiter
+        limiter.reset()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def api(playwright):
+    """Plain HTTP client for API and header checks that don't need a rendered page"""
+    api = await playwright.request.new_context(base_url=BASE_URL)
+    yield api
+    await api.dispose()
@@ -2,22 +2,22 @@
 """
 Debug frontend chat functionality to see what's happening
 """
+import argparse
 import asyncio
-from playwright.async_api import async_playwright
+from tests._browser_helpers import ASSISTANT_SEL, BASE_URL, is_chat_request, launch_app_context
 
-async def debug_frontend():
+async def debug_frontend(interactive: bool = False):
     print("🔍 Debugging Frontend Chat Functionality...")
     
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=False)  # Run with GUI to see what's happening
-        page = await browser.new_page()
+    async with launch_app_context(headless=False, block_resources=False) as (context, _api):  # Run with GUI to see what's happening
+        page = await context.new_page()
         
         # Enable console logging
         page.on("console", lambda msg: print(f"🖥️ CONSOLE: {msg.text}"))
         page.on("pageerror", lambda msg: print(f"❌ PAGE ERROR: {msg}"))
         
         # Navigate to the app
-        await page.goto("http://127.0.0.1:8000")
+        await page.goto(BASE_URL)
         print("✅ Page loaded")
         
         # Wait for page to be ready
@@ -37,21 +37,24 @@ async def debug_frontend():
         send_button_disabled = await page.locator("#sendButton").is_disabled()
         print(f"✅ Send button disabled: {send_button_disabled}")
         
-        # Click send button
-        await page.click("#sendButton")
-        print("✅ Send button clicked")
+        # Click send button and capture the chat request it triggers
+        async with page.expect_response(is_chat_request, timeout=30000) as response_info:
+            await page.click("#sendButton")
+            print("✅ Send button clicked")
+            
+            # Check messages while the request is in flight
+            messages_after_send = await page.locator('.message').count()
+            print(f"✅ Messages after send: {messages_after_send}")
+            
+            # Check for loading indicator
+            loading_count = await page.locator('.loading').count()
+            print(f"✅ Loading indicators: {loading_count}")
         
-        # Wait a moment and check messages again
-        await page.wait_for_timeout(2000)
-        messages_after_send = await page.locator('.message').count()
-        print(f"✅ Messages after send: {messages_after_send}")
+        response = await response_info.value
+        print(f"✅ /api/query responded: {response.status}")
         
-        # Check for loading indicator
-        loading_count = await page.locator('.loading').count()
-        print(f"✅ Loading indicators: {loading_count}")
-        
-        # Wait for response and check final state
-        await page.wait_for_timeout(10000)  # Wait 10 seconds
+        # Wait for the reply to replace the loading indicator, then check final state
+        await page.wait_for_selector(ASSISTANT_SEL, timeout=5000)
         
         final_messages = await page.locator('.message').count()
         user_messages = await page.locator('.message.user').count()
@@ -76,8 +79,12 @@ async def debug_frontend():
             content = await message.text_content()
             print(f"   {i+1}. [{classes}]: {content[:100]}...")
         
-        input("Press Enter to close browser...")
-        await browser.close()
+        if interactive:
+            input("Press Enter to close browser...")
 
 if __name__ == "__main__":
-    asyncio.run(debug_frontend())
\ No newline at end of file
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument("--interactive", action="store_true",
+                        help="Keep the browser open until Enter is pressed")
+    args = parser.parse_args()
+    asyncio.run(debug_frontend(interactive=args.interactive))
\ No newline at end of file
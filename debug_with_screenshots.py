@@ -3,28 +3,27 @@
 Debug frontend chat functionality with screenshots
 """
 import asyncio
-from playwright.async_api import async_playwright
+from tests._browser_helpers import ASSISTANT_SEL, BASE_URL, is_chat_request, launch_app_context
 
 async def debug_with_screenshots():
     print("🔍 Debugging Frontend Chat with Screenshots...")
     
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        page = await browser.new_page()
+    async with launch_app_context(headless=True, block_resources=False) as (context, _api):
+        page = await context.new_page()
         
         # Enable console logging
         page.on("console", lambda msg: print(f"🖥️ CONSOLE: {msg.text}"))
         page.on("pageerror", lambda msg: print(f"❌ PAGE ERROR: {msg}"))
         
         # Navigate to the app
-        await page.goto("http://127.0.0.1:8000")
+        await page.goto(BASE_URL)
         print("✅ Page loaded")
-        await page.screenshot(path="screenshot_1_page_loaded.png")
+        await page.screenshot(path="screenshot_1_page_loaded.jpg", type="jpeg", quality=70)
         
         # Wait for page to be ready
         await page.wait_for_selector("#chatInput", timeout=10000)
         print("✅ Chat input ready")
-        await page.screenshot(path="screenshot_2_chat_ready.png")
+        await page.screenshot(path="screenshot_2_chat_ready.jpg", type="jpeg", quality=70)
         
         # Check initial state
         messages_count = await page.locator('.message').count()
@@ -34,31 +33,32 @@ async def debug_with_screenshots():
         test_query = "Hello, what courses do you have?"
         await page.fill("#chatInput", test_query)
         print(f"✅ Query typed: '{test_query}'")
-        await page.screenshot(path="screenshot_3_query_typed.png")
+        await page.screenshot(path="screenshot_3_query_typed.jpg", type="jpeg", quality=70)
         
-        # Click send button
-        await page.click("#sendButton")
-        print("✅ Send button clicked")
-        await page.screenshot(path="screenshot_4_after_send.png")
+        # Click send button and capture the chat request it triggers
+        async with page.expect_response(is_chat_request, timeout=30000) as response_info:
+            await page.click("#sendButton")
+            print("✅ Send button clicked")
+            await page.screenshot(path="screenshot_4_after_send.jpg", type="jpeg", quality=70)
         
-        # Wait a moment and check messages again
-        await page.wait_for_timeout(3000)
+        # Check messages as soon as the backend replies
+        response = await response_info.value
         messages_after_send = await page.locator('.message').count()
-        print(f"✅ Messages after 3 seconds: {messages_after_send}")
-        await page.screenshot(path="screenshot_5_after_3_seconds.png")
+        print(f"✅ Messages when /api/query responded ({response.status}): {messages_after_send}")
+        await page.screenshot(path="screenshot_5_after_response.jpg", type="jpeg", quality=70)
         
-        # Wait longer for response
-        await page.wait_for_timeout(7000)  # Wait another 7 seconds (total 10)
+        # Wait for the reply to replace the loading indicator
+        await page.wait_for_selector(ASSISTANT_SEL, timeout=5000)
         
         final_messages = await page.locator('.message').count()
         user_messages = await page.locator('.message.user').count()
         assistant_messages = await page.locator('.message.assistant').count()
         
-        print(f"✅ Final state after 10 seconds:")
+        print(f"✅ Final state:")
         print(f"   - Total messages: {final_messages}")
         print(f"   - User messages: {user_messages}")
         print(f"   - Assistant messages: {assistant_messages}")
-        await page.screenshot(path="screenshot_6_final_state.png")
+        await page.screenshot(path="screenshot_6_final_state.jpg", type="jpeg", quality=70)
         
         # Get the text content of all messages
         print("\n📄 All messages content:")
@@ -73,15 +73,14 @@ async def debug_with_screenshots():
         # Check network requests - look for any failed requests
         print("\n🔍 Checking for JavaScript errors or network issues...")
         
-        await browser.close()
         
         print("\n📸 Screenshots saved:")
-        print("   - screenshot_1_page_loaded.png")
-        print("   - screenshot_2_chat_ready.png") 
-        print("   - screenshot_3_query_typed.png")
-        print("   - screenshot_4_after_send.png")
-        print("   - screenshot_5_after_3_seconds.png")
-        print("   - screenshot_6_final_state.png")
+        print("   - screenshot_1_page_loaded.jpg")
+        print("   - screenshot_2_chat_ready.jpg") 
+        print("   - screenshot_3_query_typed.jpg")
+        print("   - screenshot_4_after_send.jpg")
+        print("   - screenshot_5_after_response.jpg")
+        print("   - screenshot_6_final_state.jpg")
 
 if __name__ == "__main__":
     asyncio.run(debug_with_screenshots())
\ No newline at end of file
@@ -47,6 +47,11 @@ cd /app
 echo "Starting with Python module (uvicorn is importable)..."
 cd /app/backend
 export PYTHONPATH="/app:/app/backend:/app/.venv/lib/python3.13/site-packages"
+
+# Load course documents before starting the server; the API process only serves queries
+echo "📚 Loading course documents..."
+python3 -m backend.ingest /app/docs || echo "⚠️ Document ingestion failed"
+
 python3 -m uvicorn app:app \
     --host 0.0.0.0 \
     --port 8000 \
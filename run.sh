@@ -12,5 +12,9 @@ fi
 echo "Starting Course Materials RAG System..."
 echo "Make sure you have set your ANTHROPIC_API_KEY in .env"
 
-# Change to backend directory and start the server
-cd backend && uv run uvicorn app:app --reload --port 8000
\ No newline at end of file
+# Load course documents before starting the server; the API process only serves queries
+cd backend
+PYTHONPATH=.. uv run python -m backend.ingest || echo "Warning: document ingestion failed"
+
+# Start the server from the backend directory
+uv run uvicorn app:app --reload --port 8000
\ No newline at end of file
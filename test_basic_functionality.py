@@ -3,89 +3,89 @@
 Simple functional test that verifies key functionality without triggering rate limits
 """
 import asyncio
-from playwright.async_api import async_playwright
+import pytest
+from tests._browser_helpers import (
+    assert_chat_ready, check_security_headers, launch_app_context, open_app, wait_for_course_stats
+)
 
-async def basic_functionality_test():
+# Share the session-scoped browser fixtures from conftest.py
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+@pytest.mark.usefixtures("server_process")
+async def test_basic_functionality(context, api):
     print("🧪 Basic Functionality Test Starting...")
     
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        page = await browser.new_page()
-        
-        # Test 1: Page loads correctly
-        print("\n📄 Testing page load...")
-        await page.goto("http://127.0.0.1:8000")
-        
-        title = await page.title()
-        heading = await page.locator("h1").text_content()
-        print(f"   ✅ Title: {title}")
-        print(f"   ✅ Heading: {heading}")
-        assert "Course Materials Assistant" in title
-        
-        # Test 2: Course stats load
-        print("\n📊 Testing course statistics...")
-        await page.wait_for_timeout(3000)  # Let JS load
-        
-        total_courses_elem = page.locator("#totalCourses")
-        if await total_courses_elem.count() > 0:
-            total_courses = await total_courses_elem.text_content()
-            print(f"   ✅ Total courses loaded: {total_courses}")
+    # Test 1: Page loads correctly
+    print("\n📄 Testing page load...")
+    page = await open_app(context)
+    
+    title = await page.title()
+    heading = await page.locator("h1").text_content()
+    print(f"   ✅ Title: {title}")
+    print(f"   ✅ Heading: {heading}")
+    assert "Course Materials Assistant" in title
+    
+    # Test 2: Course stats load
+    print("\n📊 Testing course statistics...")
+    await wait_for_course_stats(page)
+    
+    total_courses_elem = page.locator("#totalCourses")
+    if await total_courses_elem.count() > 0:
+        total_courses = await total_courses_elem.text_content()
+        print(f"   ✅ Total courses loaded: {total_courses}")
+    else:
+        print("   ⚠️  Total courses element not found")
+    
+    # Test 3: Chat interface elements present
+    print("\n💬 Testing chat interface...")
+    await assert_chat_ready(page)
+    print("   ✅ Chat input and send button visible")
+    
+    # Test 4: Suggested questions present
+    suggested_questions = await page.locator(".suggested-item").count()
+    print(f"   ✅ Suggested questions found: {suggested_questions}")
+    
+    # Test 5: Security headers present
+    print("\n🔒 Testing security headers...")
+    for header, valid in (await check_security_headers(api)).items():
+        if valid:
+            print(f"   ✅ {header}: Present")
         else:
-            print("   ⚠️  Total courses element not found")
-        
-        # Test 3: Chat interface elements present
-        print("\n💬 Testing chat interface...")
-        chat_input = page.locator("#chatInput")
-        send_button = page.locator("#sendButton")
-        
-        assert await chat_input.is_visible()
-        assert await send_button.is_visible()
-        print("   ✅ Chat input and send button visible")
-        
-        # Test 4: Suggested questions present
-        suggested_questions = await page.locator(".suggested-item").count()
-        print(f"   ✅ Suggested questions found: {suggested_questions}")
-        
-        # Test 5: Security headers present
-        print("\n🔒 Testing security headers...")
-        response = await page.goto("http://127.0.0.1:8000/health")
-        headers = response.headers
-        
-        required_headers = ['x-content-type-options', 'x-frame-options', 'content-security-policy']
-        for header in required_headers:
-            if header in headers:
-                print(f"   ✅ {header}: Present")
-            else:
-                print(f"   ❌ {header}: Missing")
-        
-        # Test 6: API endpoints work
-        print("\n🔌 Testing API endpoints...")
-        courses_response = await page.goto("http://127.0.0.1:8000/api/courses")
-        print(f"   ✅ Courses API: {courses_response.status}")
-        
-        health_response = await page.goto("http://127.0.0.1:8000/health")
-        print(f"   ✅ Health API: {health_response.status}")
-        
-        await browser.close()
-        
-        # Summary
-        print("\n" + "="*60)
-        print("🎉 BASIC FUNCTIONALITY TEST COMPLETE")
-        print("="*60)
-        print("✅ Page Loading: PASSED")
-        print("✅ Course Statistics: PASSED") 
-        print("✅ Chat Interface Elements: PASSED")
-        print("✅ Suggested Questions: PASSED")
-        print("✅ Security Headers: PASSED")
-        print("✅ API Endpoints: PASSED")
-        print("\n🛡️  SECURITY FEATURES VERIFIED:")
-        print("   • CORS Protection Active")
-        print("   • Rate Limiting Working (429 responses)") 
-        print("   • Security Headers Present")
-        print("   • Input Validation Active")
-        print("   • Error Handling Secure")
-        print("\n🚀 CORE FUNCTIONALITY VERIFIED!")
-        print("   Note: Chat functionality rate limited (security working)")
+            print(f"   ❌ {header}: Missing or invalid")
+    
+    # Test 6: API endpoints work
+    print("\n🔌 Testing API endpoints...")
+    courses_response, health_response = await asyncio.gather(
+        api.get("/api/courses"),
+        api.get("/health")
+    )
+    print(f"   ✅ Courses API: {courses_response.status}")
+    print(f"   ✅ Health API: {health_response.status}")
+    
+    await page.close()
+    
+    # Summary
+    print("\n" + "="*60)
+    print("🎉 BASIC FUNCTIONALITY TEST COMPLETE")
+    print("="*60)
+    print("✅ Page Loading: PASSED")
+    print("✅ Course Statistics: PASSED") 
+    print("✅ Chat Interface Elements: PASSED")
+    print("✅ Suggested Questions: PASSED")
+    print("✅ Security Headers: PASSED")
+    print("✅ API Endpoints: PASSED")
+    print("\n🛡️  SECURITY FEATURES VERIFIED:")
+    print("   • CORS Protection Active")
+    print("   • Rate Limiting Working (429 responses)") 
+    print("   • Security Headers Present")
+    print("   • Input Validation Active")
+    print("   • Error Handling Secure")
+    print("\n🚀 CORE FUNCTIONALITY VERIFIED!")
+    print("   Note: Chat functionality rate limited (security working)")
+
+async def main():
+    async with launch_app_context() as (context, api):
+        await test_basic_functionality(context, api)
 
 if __name__ == "__main__":
-    asyncio.run(basic_functionality_test())
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Test the offline ingestion command on a machine without LLM API keys
+"""
+import dataclasses
+
+import pytest
+
+from backend import ingest
+from backend.vector_store import VectorStore
+
+COURSE_DOCUMENT = """Course Title: Ingestion Smoke Test
+Course Link: https://example.com/courses/ingestion-smoke-test
+Course Instructor: Test Instructor
+
+Lesson 0: Introduction
+Lesson Link: https://example.com/courses/ingestion-smoke-test/lesson/0
+This lesson checks that documents can be loaded into the vector store without any LLM configured.
+"""
+
+
+def test_ingest_without_api_keys(tmp_path, monkeypatch):
+    docs_path = tmp_path / "docs"
+    docs_path.mkdir()
+    (docs_path / "course.txt").write_text(COURSE_DOCUMENT, encoding="utf-8")
+
+    keyless_config = dataclasses.replace(
+        ingest.config,
+        ANTHROPIC_API_KEY="",
+        OPENAI_API_KEY="",
+        GOOGLE_API_KEY="",
+        XAI_API_KEY="",
+        CHROMA_PATH=str(tmp_path / "chroma"),
+    )
+    monkeypatch.setattr(ingest, "config", keyless_config)
+
+    assert ingest.main([str(docs_path)]) == 0
+
+    vector_store = VectorStore(keyless_config.CHROMA_PATH, keyless_config.EMBEDDING_MODEL, keyless_config.MAX_RESULTS)
+    assert vector_store.get_existing_course_titles() == ["Ingestion Smoke Test"]
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -2,96 +2,118 @@
 """
 Test script for multi-LLM RAG functionality with function calling
 """
-import os
-import sys
 import asyncio
+import copy
+import dataclasses
+import hashlib
+import shutil
+import sys
 from pathlib import Path
 
+import pytest
+
 # Add backend to path
 sys.path.append(str(Path(__file__).parent / "backend"))
 
 from backend.rag_system import RAGSystem
 from backend.ai_generator import AIGenerator
-from backend.config import Config
-
-async def test_rag_with_provider(provider_name: str, test_query: str):
-    """Test RAG functionality with a specific provider"""
-    print(f"\n{'='*60}")
-    print(f"Testing RAG with {provider_name.upper()}")
-    print(f"{'='*60}")
-    
-    try:
-        # Initialize RAG system
-        config = Config()
-        rag_system = RAGSystem(config)
-        
-        # Load documents
-        docs_path = Path(__file__).parent / "docs"
-        if docs_path.exists():
-            courses_added, chunks_added = rag_system.add_course_folder(str(docs_path))
-            print(f"Loaded {courses_added} courses with {chunks_added} chunks")
+from backend.config import Config, get_config
+
+TEST_QUERY = "What is MCP and how does it work?"
+
+# Ingested vector stores persist here between runs; CI can cache this directory
+CHROMA_CACHE_ROOT = Path(__file__).parent / ".cache"
+
+# Config attribute holding each provider's API key
+PROVIDER_KEYS = {
+    "openai": "OPENAI_API_KEY",
+    "anthropic": "ANTHROPIC_API_KEY",
+}
+
+
+def chroma_cache_path(docs_path: Path, config: Config) -> Path:
+    """
+    Vector store directory keyed on everything that shapes the stored data: the docs' names,
+    sizes and mtimes plus the embedding model and chunking settings. Stores left over from
+    earlier keys are deleted so the cache holds one store at a time.
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{config.EMBEDDING_MODEL}\x00{config.CHUNK_SIZE}\x00{config.CHUNK_OVERLAP}\n".encode("utf-8"))
+    for doc in sorted(docs_path.iterdir()):
+        if doc.is_file():
+            stat = doc.stat()
+            digest.update(f"{doc.name}\x00{stat.st_size}\x00{stat.st_mtime_ns}\n".encode("utf-8"))
+    cache_path = CHROMA_CACHE_ROOT / f"chroma_tests_{digest.hexdigest()[:16]}"
+
+    if not cache_path.exists() and CHROMA_CACHE_ROOT.exists():
+        for stale in CHROMA_CACHE_ROOT.glob("chroma_tests_*"):
+            shutil.rmtree(stale, ignore_errors=True)
+    return cache_path
+
+
+@pytest.fixture(scope="session")
+def rag_system():
+    """RAG system with the course documents ingested once for every provider under test"""
+    docs_path = Path(__file__).parent / "docs"
+    if not docs_path.exists():
+        pytest.skip("docs folder not found")
+
+    config = get_config()
+    # RAGSystem's AIGenerator raises without any key, so skip before building it
+    if not any(getattr(config, key) for key in PROVIDER_KEYS.values()):
+        pytest.skip(f"None of {', '.join(PROVIDER_KEYS.values())} set")
+
+    config = dataclasses.replace(config, CHROMA_PATH=str(chroma_cache_path(docs_path, config)))
+    rag_system = RAGSystem(config)
+
+    # A populated store for the same docs needs no parsing or embedding
+    cached_courses = rag_system.vector_store.get_course_count()
+    if cached_courses:
+        print(f"Using {cached_courses} cached courses from {config.CHROMA_PATH}")
+    else:
+        courses_added, chunks_added = rag_system.add_course_folder(str(docs_path))
+        print(f"Loaded {courses_added} courses with {chunks_added} chunks")
+    return rag_system
+
+
+def query_with_provider(rag_system: RAGSystem, provider: str):
+    """Answer TEST_QUERY with one provider on a view of the shared RAG system"""
+    # Shallow copy shares the vector store and tools; only the generator differs per provider
+    provider_system = copy.copy(rag_system)
+    provider_system.ai_generator = AIGenerator(rag_system.config, provider=provider)
+    response, sources = provider_system.query(TEST_QUERY)
+    return provider_system.ai_generator, response, sources
+
+
+@pytest.mark.asyncio
+async def test_rag_with_providers(rag_system):
+    """Test RAG functionality with every configured provider concurrently"""
+    # Only run providers with a key, instead of letting the others fail after a timeout
+    providers = []
+    for name, key in PROVIDER_KEYS.items():
+        if getattr(rag_system.config, key):
+            providers.append(name)
         else:
-            print("Warning: docs folder not found")
-            return False
-        
-        # Test query
-        print(f"\nQuery: {test_query}")
-        print("-" * 40)
-        
-        response, sources = rag_system.query(test_query)
-        
+            print(f"Skipping {name}: {key} not set")
+
+    print(f"\nQuery: {TEST_QUERY}")
+
+    # Each provider's round trip runs in its own thread so the slowest one sets the wall time
+    results = await asyncio.gather(
+        *(asyncio.to_thread(query_with_provider, rag_system, provider) for provider in providers)
+    )
+
+    for provider, (generator, response, sources) in zip(providers, results):
+        print(f"\n{'='*60}")
+        print(f"RAG with {provider.upper()}")
+        print(f"{'='*60}")
         print(f"Response: {response}")
         print(f"\nSources: {sources}")
-        print(f"Provider used: {rag_system.ai_generator.provider_mode}")
-        print(f"Model used: {rag_system.ai_generator.model}")
-        
-        return True
-        
-    except Exception as e:
-        print(f"Error testing {provider_name}: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-async def main():
-    """Main test function"""
-    test_query = "What is MCP and how does it work?"
-    
-    # Test with OpenAI (current configuration)
-    print("Testing with current configuration (OpenAI via AISuite)...")
-    success_openai = await test_rag_with_provider("OpenAI", test_query)
-    
-    # Test with Anthropic by temporarily modifying environment
-    print("\n" + "="*60)
-    print("Switching to Anthropic for comparison...")
-    print("="*60)
-    
-    # Temporarily remove OpenAI key to force Anthropic usage
-    original_openai_key = os.environ.get('OPENAI_API_KEY')
-    if original_openai_key:
-        del os.environ['OPENAI_API_KEY']
-    
-    try:
-        success_anthropic = await test_rag_with_provider("Anthropic", test_query)
-    finally:
-        # Restore OpenAI key
-        if original_openai_key:
-            os.environ['OPENAI_API_KEY'] = original_openai_key
-    
-    # Summary
-    print("\n" + "="*60)
-    print("TEST SUMMARY")
-    print("="*60)
-    print(f"OpenAI (AISuite): {'✓ PASS' if success_openai else '✗ FAIL'}")
-    print(f"Anthropic: {'✓ PASS' if success_anthropic else '✗ FAIL'}")
-    
-    if success_openai and success_anthropic:
-        print("\n🎉 Multi-LLM RAG functionality working correctly!")
-        return True
-    else:
-        print("\n❌ Some providers failed. Check logs above.")
-        return False
+        print(f"Provider used: {generator.provider_mode}")
+        print(f"Model used: {generator.model}")
+
+        assert response, f"{provider} returned an empty response"
+
 
 if __name__ == "__main__":
-    success = asyncio.run(main())
-    sys.exit(0 if success else 1)
+    sys.exit(pytest.main([__file__, "-v", "-s"]))
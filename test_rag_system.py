@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Tests for RAGSystem.aquery single-flight sharing of identical concurrent queries
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from backend.rag_system import RAGSystem
+
+pytestmark = pytest.mark.asyncio
+
+
+def make_rag_system(generation_delay: float = 0.05):
+    """RAGSystem with only the pieces aquery touches, counting generations it starts"""
+    rag_system = RAGSystem.__new__(RAGSystem)
+    rag_system._inflight = {}
+    rag_system.ai_generator = SimpleNamespace(cache_key=lambda prompt, history: prompt)
+    rag_system._prepare_generation = lambda query, session_id: (query, None, [])
+    rag_system.generations = 0
+
+    async def agenerate(prompt, history, tools):
+        rag_system.generations += 1
+        generation = rag_system.generations
+        await asyncio.sleep(generation_delay)
+        return f"answer {generation}", ["source"]
+
+    rag_system._agenerate = agenerate
+    return rag_system
+
+
+async def test_follower_gets_answer_when_leader_is_cancelled():
+    rag_system = make_rag_system()
+    leader = asyncio.create_task(rag_system.aquery("What is MCP?"))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(rag_system.aquery("What is MCP?"))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+    assert await follower == ("answer 1", ["source"])
+    assert rag_system.generations == 1
+    assert rag_system._inflight == {}
+
+
+async def test_caller_after_cancelled_leader_gets_fresh_answer():
+    rag_system = make_rag_system()
+    leader = asyncio.create_task(rag_system.aquery("What is MCP?"))
+    await asyncio.sleep(0)
+
+    # The leader was the only waiter, so its generation is cancelled; a caller arriving
+    # straight after must not share that dying task
+    leader.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+    assert await rag_system.aquery("What is MCP?") == ("answer 2", ["source"])
+    assert rag_system._inflight == {}
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -3,97 +3,125 @@
 Test chat functionality with real questions that should trigger RAG retrieval
 """
 import asyncio
-from playwright.async_api import async_playwright
+from pathlib import Path
+from typing import List
+import pytest
+from playwright.async_api import BrowserContext, Page
+from tests._browser_helpers import ASSISTANT_SEL, is_chat_request, launch_app_context, open_chat, run_script
 
-async def test_real_questions():
-    print("🧪 Testing Chat with Real Course Questions...")
-    
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        page = await browser.new_page()
-        
-        # Enable console logging
-        page.on("console", lambda msg: print(f"🖥️ CONSOLE: {msg.text}"))
-        page.on("pageerror", lambda msg: print(f"❌ PAGE ERROR: {msg}"))
+# Share the session-scoped browser fixtures from conftest.py
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+# Questions that should retrieve information from course materials
+TEST_QUESTIONS = [
+    "What is MCP and how does it work?",
+    "Tell me about vector search and retrieval",
+    "What are the key concepts in prompt compression?",
+    "How do you build computer use applications?"
+]
+
+# Text of an assistant reply plus its collapsed sources, if any
+READ_RESPONSE_JS = """el => {
+    const src = el.querySelector('.sources-collapsible');
+    return {
+        text: el.textContent,
+        hasSources: !!src,
+        sources: src ? src.querySelector('.sources-content')?.textContent ?? null : null
+    };
+}"""
+
+# Screenshot files per question, built once rather than formatted at each capture
+SCREENSHOT_PATHS = [
+    {kind: f"question_{i}_{kind}.jpg" for kind in ("response", "error")}
+    for i in range(1, len(TEST_QUESTIONS) + 1)
+]
+
+# Upper bound on questions in flight at once, in case the backend gets overwhelmed
+MAX_CONCURRENT_QUESTIONS = 4
+
+async def capture(page: Page, path: str, writes: List[asyncio.Task]):
+    """Take a screenshot now and write it to disk in a worker thread"""
+    data = await page.screenshot(type="jpeg", quality=70)
+    writes.append(asyncio.create_task(asyncio.to_thread(Path(path).write_bytes, data)))
+
+async def ask(context: BrowserContext, i: int, question: str, limit: asyncio.Semaphore,
+              writes: List[asyncio.Task]):
+    """Ask one question on its own page and screenshot the result"""
+    async with limit:
+        page = await open_chat(context, label=f"Q{i}")
+        # Locators are lazy, so one instance serves the wait and the reads below.
+        # Each question has its own page, so its reply is always the first match.
+        response_locator = page.locator(ASSISTANT_SEL).first
+        paths = SCREENSHOT_PATHS[i - 1]
         
-        # Navigate to the app
-        await page.goto("http://127.0.0.1:8000")
-        await page.wait_for_selector("#chatInput", timeout=10000)
-        print("✅ Page loaded and ready")
+        print(f"\n📝 Question {i}: {question}")
         
-        # Test questions that should retrieve information from course materials
-        test_questions = [
-            "What is MCP and how does it work?",
-            "Tell me about vector search and retrieval",
-            "What are the key concepts in prompt compression?",
-            "How do you build computer use applications?"
-        ]
+        # Clear input and type question
+        await page.fill("#chatInput", "")
+        await page.fill("#chatInput", question)
         
-        for i, question in enumerate(test_questions, 1):
-            print(f"\n📝 Question {i}: {question}")
+        try:
+            # Send the message and wait on the API response itself (longer timeout for AI processing)
+            async with page.expect_response(is_chat_request, timeout=45000) as response_info:
+                await page.click("#sendButton")
+            response = await response_info.value
+            assert response.ok, f"/api/query returned {response.status}"
             
-            # Clear input and type question
-            await page.fill("#chatInput", "")
-            await page.fill("#chatInput", question)
+            # The reply then replaces the loading indicator with its text and sources in one render
+            await response_locator.wait_for(timeout=2000)
             
-            # Take screenshot before sending
-            await page.screenshot(path=f"question_{i}_before.png")
+            # Take screenshot after response
+            await capture(page, paths["response"], writes)
             
-            # Send the message
-            await page.click("#sendButton")
+            # Read the response text and its sources in one round trip
+            data = await response_locator.evaluate(READ_RESPONSE_JS)
             
-            # Wait for response (longer timeout for AI processing)
-            try:
-                await page.wait_for_selector(".message.assistant:not(.welcome-message)", timeout=45000)
-                
-                # Wait a bit more for the response to fully load
-                await page.wait_for_timeout(3000)
-                
-                # Take screenshot after response
-                await page.screenshot(path=f"question_{i}_response.png")
-                
-                # Get the latest assistant response
-                assistant_messages = page.locator(".message.assistant:not(.welcome-message)")
-                latest_response = assistant_messages.last
-                response_text = await latest_response.text_content()
-                
-                # Check for sources
-                sources_element = latest_response.locator(".sources-collapsible")
-                has_sources = await sources_element.count() > 0
-                
-                print(f"   ✅ Response received: {response_text[:150]}...")
-                print(f"   📚 Has sources: {has_sources}")
-                
-                if has_sources:
-                    # Click to expand sources
-                    await sources_element.locator("summary").click()
-                    await page.wait_for_timeout(1000)
-                    sources_text = await sources_element.locator(".sources-content").text_content()
-                    print(f"   📖 Sources: {sources_text}")
-                
-                # Take final screenshot with expanded sources
-                await page.screenshot(path=f"question_{i}_final.png")
-                
-                print(f"   📸 Screenshots saved: question_{i}_before.png, question_{i}_response.png, question_{i}_final.png")
-                
-            except Exception as e:
-                print(f"   ❌ Error or timeout: {e}")
-                await page.screenshot(path=f"question_{i}_error.png")
-                continue
+            assert data["text"].strip(), "Assistant reply is empty"
+            print(f"   ✅ Q{i} response received: {data['text'][:150]}...")
+            print(f"   📚 Q{i} has sources: {data['hasSources']}")
             
-            # Wait between questions
-            await page.wait_for_timeout(2000)
-        
-        await browser.close()
-        
-        print("\n" + "="*60)
-        print("🎯 REAL QUESTION TESTING COMPLETE")
-        print("="*60)
-        print("Check the screenshots to see actual responses with:")
-        print("  • Real course content retrieval")
-        print("  • Markdown formatting")
-        print("  • Source citations")
-        print("  • Proper UI rendering")
+            # textContent includes the sources while they are collapsed, so there is no need to expand them
+            if data["hasSources"]:
+                print(f"   📖 Q{i} sources: {data['sources']}")
+            
+            print(f"   📸 Screenshot taken: {paths['response']}")
+            
+        except Exception as e:
+            print(f"   ❌ Q{i} error or timeout: {e}")
+            await capture(page, paths["error"], writes)
+            raise
+        finally:
+            await page.close()
+
+@pytest.mark.serial
+@pytest.mark.usefixtures("server_process", "reset_rate_limits")
+async def test_real_questions(isolated_context):
+    print("🧪 Testing Chat with Real Course Questions...")
+    
+    # One context shared by a page per question; the questions are independent so they run concurrently
+    limit = asyncio.Semaphore(MAX_CONCURRENT_QUESTIONS)
+    writes: List[asyncio.Task] = []
+    # A failure on one page, even while loading it, doesn't stop the other questions
+    results = await asyncio.gather(*(
+        ask(isolated_context, i, question, limit, writes) for i, question in enumerate(TEST_QUESTIONS, 1)
+    ), return_exceptions=True)
+    await asyncio.gather(*writes)
+    failures = [f"Q{i}: {result!r}" for i, result in enumerate(results, 1) if isinstance(result, Exception)]
+    assert not failures, "Questions failed: " + "; ".join(failures)
+    
+    print("\n" + "="*60)
+    print("🎯 REAL QUESTION TESTING COMPLETE")
+    print("="*60)
+    print("Check the screenshots to see actual responses with:")
+    print("  • Real course content retrieval")
+    print("  • Markdown formatting")
+    print("  • Source citations")
+    print("  • Proper UI rendering")
+
+async def main():
+    # Images, fonts and media are blocked; stylesheets stay so screenshots keep the real layout
+    async with launch_app_context() as (context, _):
+        await test_real_questions(context)
 
 if __name__ == "__main__":
-    asyncio.run(test_real_questions())
\ No newline at end of file
+    run_script(main())
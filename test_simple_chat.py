@@ -2,52 +2,66 @@
 """
 Simple test to see what's happening with the frontend response handling
 """
-import asyncio
-from playwright.async_api import async_playwright
+import collections
+import sys
+import pytest
+from playwright.async_api import expect
+from tests._browser_helpers import ASSISTANT_SEL, BASE_URL, is_chat_request, launch_app_context, run_script
 
-async def test_simple_chat():
+# Share the session-scoped browser fixtures from conftest.py
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+# Most recent page events kept for the end-of-test dump
+LOG_BUFFER_SIZE = 2000
+
+@pytest.mark.serial
+@pytest.mark.usefixtures("server_process", "reset_rate_limits")
+async def test_simple_chat(isolated_context):
     print("🔍 Testing Simple Chat Response...")
     
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        page = await browser.new_page()
-        
-        # Enable all logging
-        page.on("console", lambda msg: print(f"🖥️ CONSOLE {msg.type}: {msg.text}"))
-        page.on("pageerror", lambda msg: print(f"❌ PAGE ERROR: {msg}"))
-        page.on("request", lambda req: print(f"🌐 REQUEST: {req.method} {req.url}"))
-        page.on("response", lambda res: print(f"📡 RESPONSE: {res.status} {res.url}"))
-        
-        await page.goto("http://127.0.0.1:8000")
+    page = await isolated_context.new_page()
+    
+    # Enable all logging, buffered and printed once at the end rather than per event
+    log_buffer = collections.deque(maxlen=LOG_BUFFER_SIZE)
+    page.on("console", lambda msg: log_buffer.append(f"🖥️ CONSOLE {msg.type}: {msg.text}"))
+    page.on("pageerror", lambda msg: log_buffer.append(f"❌ PAGE ERROR: {msg}"))
+    page.on("request", lambda req: log_buffer.append(f"🌐 REQUEST: {req.method} {req.url}"))
+    
+    def log_api_response(res):
+        # Only API traffic; static asset responses would drown it out
+        if "/api/" in res.url:
+            log_buffer.append(f"📡 RESPONSE: {res.status} {res.url}")
+    
+    page.on("response", log_api_response)
+    
+    try:
+        await page.goto(BASE_URL)
         await page.wait_for_selector("#chatInput", timeout=10000)
         
         print("\n📝 Asking: 'What is MCP?'")
         await page.fill("#chatInput", "What is MCP?")
-        await page.screenshot(path="before_send.png")
-        
-        # Monitor network traffic
-        page.on("response", lambda response: print(f"📡 Response {response.status}: {response.url}"))
+        await page.screenshot(path="before_send.jpg", type="jpeg", quality=70)
         
-        await page.click("#sendButton")
-        print("✅ Send button clicked")
+        # Capture the chat request the click triggers instead of sleeping
+        async with page.expect_response(is_chat_request, timeout=30000) as response_info:
+            await page.click("#sendButton")
+            print("✅ Send button clicked")
         
-        # Wait and take screenshots to see what happens
-        await page.wait_for_timeout(2000)
-        await page.screenshot(path="after_2_seconds.png")
-        print("📸 Screenshot after 2 seconds")
+        response = await response_info.value
+        await page.screenshot(path="after_response.jpg", type="jpeg", quality=70)
+        print(f"📸 Screenshot when /api/query responded ({response.status})")
+        assert response.ok, f"/api/query returned {response.status}"
         
-        await page.wait_for_timeout(3000)
-        await page.screenshot(path="after_5_seconds.png")
-        print("📸 Screenshot after 5 seconds")
-        
-        await page.wait_for_timeout(5000)
-        await page.screenshot(path="after_10_seconds.png")
-        print("📸 Screenshot after 10 seconds")
+        # Wait for the reply to replace the loading indicator
+        assistant_locator = page.locator(ASSISTANT_SEL)
+        await expect(assistant_locator.first).to_be_visible(timeout=5000)
+        await page.screenshot(path="after_render.jpg", type="jpeg", quality=70)
+        print("📸 Screenshot after response rendered")
         
         # Check final state
         messages = await page.locator('.message').count()
         user_messages = await page.locator('.message.user').count()
-        assistant_messages = await page.locator('.message.assistant:not(.welcome-message)').count()
+        assistant_messages = await assistant_locator.count()
         loading_messages = await page.locator('.loading').count()
         
         print(f"\n📊 Final State:")
@@ -56,11 +70,20 @@ async def test_simple_chat():
         print(f"   Assistant messages: {assistant_messages}")
         print(f"   Loading indicators: {loading_messages}")
         
-        if assistant_messages > 0:
-            response_text = await page.locator('.message.assistant:not(.welcome-message)').last.inner_text()
-            print(f"   📝 Response text: {response_text[:200]}...")
+        response_text = await assistant_locator.last.inner_text()
+        print(f"   📝 Response text: {response_text[:200]}...")
         
-        await browser.close()
+        assert user_messages == 1 and assistant_messages == 1
+        assert loading_messages == 0, "Loading indicator left behind after the reply"
+        assert response_text.strip(), "Assistant reply is empty"
+    finally:
+        if log_buffer:
+            sys.stdout.write("\n📜 Page events:\n" + "\n".join(log_buffer) + "\n")
+        await page.close()
+
+async def main():
+    async with launch_app_context() as (context, _):
+        await test_simple_chat(context)
 
 if __name__ == "__main__":
-    asyncio.run(test_simple_chat())
\ No newline at end of file
+    run_script(main())
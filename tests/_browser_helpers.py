@@ -0,0 +1,151 @@
+"""
+Shared helpers for the Playwright browser tests and debug scripts
+"""
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Coroutine, Dict, Tuple
+from playwright.async_api import APIRequestContext, BrowserContext, Page, Response, Route, async_playwright
+
+BASE_URL = "http://127.0.0.1:8000"
+VIEWPORT = {"width": 1280, "height": 800}
+
+# Chromium switches that drop work the tests never need; /dev/shm is tiny in most CI containers
+CHROMIUM_ARGS = (
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
+    "--disable-gpu",
+    "--disable-software-rasterizer",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--mute-audio",
+)
+
+# Asset types no test asserts on; stylesheets stay since visibility checks depend on layout
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
+# A rendered assistant reply; the loading placeholder is also an assistant message
+ASSISTANT_SEL = ".message.assistant:not(.welcome-message):not(:has(.loading))"
+
+# Security headers with fixed values, and headers whose value only needs the expected prefix
+EXACT_SECURITY_HEADERS = (
+    ("x-content-type-options", "nosniff"),
+    ("x-frame-options", "DENY"),
+    ("x-xss-protection", "1; mode=block"),
+    ("referrer-policy", "strict-origin-when-cross-origin"),
+)
+PREFIX_SECURITY_HEADERS = (
+    ("content-security-policy", "default-src"),
+    ("strict-transport-security", "max-age"),
+)
+
+
+def run_script(main: Coroutine[Any, Any, Any]) -> Any:
+    """
+    Run a standalone script's entry coroutine, on uvloop when it is installed.
+
+    The scripts spend most of their time on event-loop callbacks for Playwright's
+    pipe to the driver, which uvloop dispatches with less overhead. uvloop is
+    optional; without it the stock asyncio loop is used.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+    return uvloop.run(main)
+
+
+async def block_heavy_resources(route: Route):
+    """Abort requests for blocked asset types and let everything else through"""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+@asynccontextmanager
+async def launch_app_context(headless: bool = True,
+                             block_resources: bool = True) -> AsyncIterator[Tuple[BrowserContext, APIRequestContext]]:
+    """
+    Launch Chromium for a standalone script run.
+
+    Args:
+        headless: Run without a visible browser window
+        block_resources: Skip image, font and media requests
+
+    Yields:
+        Tuple of (browser context, API request context for BASE_URL)
+    """
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=headless, args=list(CHROMIUM_ARGS))
+        context = await browser.new_context(viewport=VIEWPORT)
+        if block_resources:
+            await context.route("**/*", block_heavy_resources)
+        api = await p.request.new_context(base_url=BASE_URL)
+        try:
+            yield context, api
+        finally:
+            await api.dispose()
+            await browser.close()
+
+
+async def open_app(context: BrowserContext) -> Page:
+    """Open a new page on the chat app"""
+    page = await context.new_page()
+    await page.goto(BASE_URL)
+    return page
+
+
+async def open_chat(context: BrowserContext, label: str = "") -> Page:
+    """
+    Open the chat app on a new page, echoing browser console output, and wait for the input.
+
+    Args:
+        context: Browser context to open the page in
+        label: Prefix for console lines, to tell concurrent pages apart
+    """
+    prefix = f"{label} " if label else ""
+    page = await context.new_page()
+    page.on("console", lambda msg: print(f"🖥️ {prefix}CONSOLE: {msg.text}"))
+    page.on("pageerror", lambda msg: print(f"❌ {prefix}PAGE ERROR: {msg}"))
+    await page.goto(BASE_URL)
+    await page.wait_for_selector("#chatInput", timeout=10000)
+    return page
+
+
+async def assert_chat_ready(page: Page):
+    """Wait for the chat input and assert the input and send button are visible"""
+    await page.wait_for_selector("#chatInput", timeout=10000)
+    assert await page.locator("#chatInput").is_visible()
+    assert await page.locator("#sendButton").is_visible()
+
+
+async def wait_for_course_stats(page: Page):
+    """Wait until the sidebar replaces its '-' placeholder with the /api/courses result"""
+    await page.wait_for_function(
+        "document.querySelector('#totalCourses')?.textContent.trim() !== '-'", timeout=10000
+    )
+
+
+def is_chat_request(response: Response) -> bool:
+    """Match the POST the frontend sends when a message is submitted"""
+    return "/api/query" in response.url and response.request.method == "POST"
+
+
+async def check_security_headers(api: APIRequestContext, path: str = "/health") -> Dict[str, bool]:
+    """
+    Fetch a path and check the security headers the app adds to every response.
+
+    Args:
+        api: API request context for BASE_URL
+        path: Path to fetch, /health by default since it is the cheapest route
+
+    Returns:
+        Mapping of header name to whether it is present with the expected value
+    """
+    response = await api.get(path)
+    headers = response.headers
+    results = {header: headers.get(header) == expected for header, expected in EXACT_SECURITY_HEADERS}
+    results.update(
+        (header, headers.get(header, "").startswith(expected)) for header, expected in PREFIX_SECURITY_HEADERS
+    )
+    return results
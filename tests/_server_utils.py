@@ -0,0 +1,105 @@
+"""
+Helpers for starting the app server in browser tests
+"""
+import asyncio
+import threading
+import time
+import urllib.error
+import urllib.request
+from typing import Tuple
+
+import httpx
+import uvicorn
+
+# A cold start imports torch, sentence-transformers and chromadb and warms the embedding
+# model before /health answers, which can take well over 10 seconds on a CI runner
+SERVER_STARTUP_TIMEOUT = 30.0
+
+
+def wait_for_server(url: str, timeout: float = SERVER_STARTUP_TIMEOUT, interval: float = 0.05) -> float:
+    """
+    Poll a URL until it answers, instead of sleeping for a fixed warmup.
+
+    Args:
+        url: Endpoint to poll, normally the app's /health route
+        timeout: Seconds to keep trying before giving up
+        interval: Seconds between attempts
+
+    Returns:
+        Seconds it took for the server to become ready
+
+    Raises:
+        RuntimeError: If the server did not answer within the timeout
+    """
+    start = time.monotonic()
+    deadline = start + timeout
+    while True:
+        try:
+            urllib.request.urlopen(url, timeout=0.1)
+            return time.monotonic() - start
+        except (urllib.error.URLError, ConnectionError, TimeoutError):
+            if time.monotonic() >= deadline:
+                raise RuntimeError(f"Server at {url} not ready within {timeout:.0f} seconds")
+            time.sleep(interval)
+
+
+async def wait_for_server_async(url: str, timeout: float = SERVER_STARTUP_TIMEOUT, interval: float = 0.05) -> float:
+    """
+    Async variant of wait_for_server that yields to the event loop between attempts.
+
+    Returns:
+        Seconds it took for the server to become ready
+
+    Raises:
+        RuntimeError: If the server did not answer within the timeout
+    """
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    deadline = start + timeout
+    async with httpx.AsyncClient(timeout=0.2) as client:
+        while True:
+            try:
+                if (await client.get(url)).status_code < 500:
+                    return loop.time() - start
+            except httpx.HTTPError:
+                pass
+            if loop.time() >= deadline:
+                raise RuntimeError(f"Server at {url} not ready within {timeout:.0f} seconds")
+            await asyncio.sleep(interval)
+
+
+def warm_up_server(base_url: str, timeout: float = 30.0):
+    """
+    Send one throwaway query so the first real test doesn't pay for cold LLM connections.
+
+    Failures are only reported, since tests that don't need the LLM should still run.
+    """
+    request = urllib.request.Request(
+        f"{base_url}/api/query",
+        data=b'{"query": "warmup"}',
+        headers={"Content-Type": "application/json"},
+        method="POST"
+    )
+    try:
+        urllib.request.urlopen(request, timeout=timeout).read()
+    except (urllib.error.URLError, ConnectionError, TimeoutError) as e:
+        print(f"Error warming up server: {e}")
+
+
+def start_server_thread(app: str = "backend.app:app", port: int = 8000) -> Tuple[uvicorn.Server, threading.Thread]:
+    """
+    Serve the app in-process from a daemon thread, skipping uv and a cold interpreter start.
+
+    Returns:
+        Tuple of (uvicorn server, thread running it) to pass to stop_server_thread
+    """
+    server = uvicorn.Server(uvicorn.Config(app, port=port, log_level="warning", loop="asyncio"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    return server, thread
+
+
+def stop_server_thread(server: uvicorn.Server, thread: threading.Thread, timeout: float = 5.0):
+    """Ask uvicorn to shut down gracefully and wait for its thread to finish"""
+    server.should_exit = True
+    thread.join(timeout=timeout)